@@ -17,6 +17,17 @@ from utils.helpers import (
 
 logger = logging.getLogger(__name__)
 
+# Which of the created folders each file type is copied into. Looked up once per
+# file, so it is built once here rather than on every call.
+TYPE_TO_FOLDER = {
+    'GSTR-3B Export': 'gstr3b',
+    'GSTR-2B Reco': 'itc',
+    'IMS Reco': 'itc',
+    'Sales': 'sales',
+    'Sales Reco': 'sales',
+    'Annual Report': 'version'  # Goes in version folder
+}
+
 
 class FileOrganizer:
     """
@@ -302,16 +313,7 @@ class FileOrganizer:
     def _get_destination_folder(self, file_type: str, 
                               folders: Dict[str, Path]) -> Optional[Path]:
         """Get destination folder for file type"""
-        type_to_folder = {
-            'GSTR-3B Export': 'gstr3b',
-            'GSTR-2B Reco': 'itc',
-            'IMS Reco': 'itc',
-            'Sales': 'sales',
-            'Sales Reco': 'sales',
-            'Annual Report': 'version'  # Goes in version folder
-        }
-        
-        folder_key = type_to_folder.get(file_type)
+        folder_key = TYPE_TO_FOLDER.get(file_type)
         return folders.get(folder_key) if folder_key else None
     
     def create_organization_report(self, folders: Dict[str, Path],
@@ -251,13 +251,14 @@ class FileParser:
     
     def _analyze_client_completeness(self):
         """Analyze which files are missing for each client"""
+        # The same for every client, so built once rather than per client.
+        expected_types = set(self.expected_types)
         for client_key, client_info in self.client_data.items():
             found_types = set(client_info['files'].keys())
-            expected_types = set(self.expected_types)
             
             # Find missing files
             missing = expected_types - found_types
-            client_info['missing_files'] = sorted(list(missing))
+            client_info['missing_files'] = sorted(missing)
             
             # Find duplicate/extra files
             extras = []
@@ -307,15 +308,21 @@ class FileParser:
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get scanning statistics"""
+        # One pass over the files and one over the clients, each tallying
+        # everything it feeds; these were two separate sweeps apiece.
         total_files = len(self.scanned_files)
-        parsed_files = sum(1 for f in self.scanned_files.values() if f.get('parsed'))
-        total_size = sum(f.get('size', 0) for f in self.scanned_files.values())
-        
-        complete_clients = sum(1 for c in self.client_data.values() 
-                             if c['status'] == 'Complete')
+        parsed_files = 0
+        total_size = 0
+        for f in self.scanned_files.values():
+            if f.get('parsed'):
+                parsed_files += 1
+            total_size += f.get('size', 0)
         
+        complete_clients = 0
         file_type_dist = defaultdict(int)
         for client in self.client_data.values():
+            if client['status'] == 'Complete':
+                complete_clients += 1
             for file_type, files in client['files'].items():
                 file_type_dist[file_type] += len(files)
         
@@ -4,8 +4,26 @@ GUI package for GST File Organizer v3.0
 Contains the graphical user interface components.
 """
 
-from .main_window import GSTOrganizerApp
+import importlib
+
+# Loaded on first access (PEP 562), as in gui.utils. Every module under gui/ -
+# including the Tk-free ones like gui.utils.cache_manager - imports this
+# package first, and loading the whole main window for them was pure start-up
+# cost.
+_EXPORTS = {
+    'GSTOrganizerApp': '.main_window',
+}
 
 __all__ = ['GSTOrganizerApp']
 
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __version__ = '3.0.0'
\ No newline at end of file
@@ -4,9 +4,80 @@
 import os
 from datetime import datetime
 from pathlib import Path
+import tkinter.font as tkfont
 from tkinter import messagebox, filedialog
-from utils.constants import GUI_CONFIG
-from utils.helpers import get_state_code
+from utils.constants import CLIENT_TREE_COLUMNS
+
+FIT_PADDING_PX = 16     # cell padding either side of the measured text
+FIT_MAX_WIDTH_PX = 400
+
+# A row's colour comes from its tag, configured once on the tree (validation_tab)
+# and by DarkModeManager.update_tree_tags. The tag tuples are shared by every
+# row rather than built per client.
+COMPLETE_TAGS = ('complete',)
+INCOMPLETE_TAGS = ('incomplete',)
+
+# Counts shown in the tree are almost always small, so their text is made once
+# here instead of with str() per row.
+_SMALL_INTS = tuple(str(i) for i in range(256))
+
+
+def _count_text(n):
+    return _SMALL_INTS[n] if 0 <= n < len(_SMALL_INTS) else str(n)
+
+
+# Inserts a whole batch of top-level rows in one call and returns their ids.
+# `rows` is a flat list: row text, its values list, its tags list.
+TREE_INSERT_PROC = (
+    'proc ::gst_tree_insert {tree rows} {'
+    ' set ids {};'
+    ' foreach {text values tags} $rows {'
+    ' lappend ids [$tree insert {} end -text $text -values $values -tags $tags] };'
+    ' return $ids }'
+)
+
+# Sets the check box text of many rows in one call; see ClientHandler._set_checks.
+TREE_SET_TEXT_PROC = (
+    'proc ::gst_tree_set_text {tree ids text} {'
+    ' foreach id $ids { $tree item $id -text $text } }'
+)
+
+# Sets one column of many rows to the same value in one call.
+TREE_SET_CELL_PROC = (
+    'proc ::gst_tree_set_cell {tree ids column value} {'
+    ' foreach id $ids { $tree set $id $column $value } }'
+)
+
+FOLDER_NAME_COLUMN = 'FolderName'
+FOLDER_NAME_ON = '☑ Yes'
+FOLDER_NAME_OFF = '☐ No'
+
+
+def client_rows(client_data):
+    """The client tree's rows for scanned client data, in display order.
+
+    Returns a list of (client_key, values, tags): the cell texts in
+    CLIENT_TREE_COLUMNS order and the row's colour tags. Plain data with no Tk
+    in it, so the whole table is worked out before the tree is touched -
+    ClientHandler then hands it to Tk in one go.
+    """
+    rows = []
+    for client_key, client_info in client_data.items():
+        missing = ', '.join(client_info['missing_files']) if client_info['missing_files'] else 'None'
+        # All text: Tk keeps every cell as a string, and _fit_columns
+        # measures them as they are.
+        values = (
+            client_info['client'],
+            client_info['state'],
+            f"{client_info.get('status_icon', '')} {client_info['status']}",
+            _count_text(client_info['file_count']),
+            missing,
+            _count_text(len(client_info['extra_files'])),
+            FOLDER_NAME_OFF
+        )
+        tags = COMPLETE_TAGS if client_info['status'] == 'Complete' else INCOMPLETE_TAGS
+        rows.append((client_key, values, tags))
+    return rows
 
 
 class ClientHandler:
@@ -14,69 +85,111 @@ class ClientHandler:
     
     def __init__(self, app_instance):
         self.app = app_instance
+        for proc in (TREE_INSERT_PROC, TREE_SET_TEXT_PROC, TREE_SET_CELL_PROC):
+            app_instance.root.tk.eval(proc)
+        # Filled as the tree is populated: tree item -> client key, and the
+        # items of complete clients. The selection helpers read these instead
+        # of reading every row's values back out of the tree.
+        self._item_keys = {}
+        self._complete_items = set()
+        # column id -> width _fit_columns last gave it
+        self._column_widths = {}
     
     def update_client_tree(self):
         """Update client tree display"""
         if not hasattr(self.app, 'client_tree'):
             return
-        
-        # Clear existing
-        for item in self.app.client_tree.get_children():
-            self.app.client_tree.delete(item)
+        tree = self.app.client_tree
         
         self.app.selected_clients = {}
+        self._item_keys = {}
+        self._complete_items = set()
         
-        # Add clients
-        for client_key, client_info in self.app.client_data.items():
-            missing = ', '.join(client_info['missing_files']) if client_info['missing_files'] else 'None'
-            extra = str(len(client_info['extra_files'])) if client_info['extra_files'] else '0'
-            
-            item = self.app.client_tree.insert('', 'end',
-                                        text='☐',
-                                        values=(
-                                            client_info['client'],
-                                            client_info['state'],
-                                            f"{client_info.get('status_icon', '')} {client_info['status']}",
-                                            client_info['file_count'],
-                                            missing,
-                                            extra,
-                                            '☐ No'
-                                        ))
-            
-            self.app.selected_clients[item] = False
-            
-            # Initialize folder name setting
-            self.app.client_folder_settings[client_key] = False
-            
-            # Color coding
-            if client_info['status'] == 'Complete':
-                self.app.client_tree.item(item, tags=('complete',))
-            else:
-                self.app.client_tree.item(item, tags=('incomplete',))
+        # Build every row first so the columns can be sized once, up front.
+        rows = client_rows(self.app.client_data)
         
-        # Configure tags
-        self.app.client_tree.tag_configure('complete', background=GUI_CONFIG['colors']['complete'])
-        self.app.client_tree.tag_configure('incomplete', background=GUI_CONFIG['colors']['incomplete'])
+        # Detach the scrollbars while the old rows go and the new ones come in:
+        # otherwise they are recomputed after the clear and after every row.
+        #
+        # The row tag colours are NOT set here. They were re-configured after
+        # every insert pass, which restyled every row a second time and put the
+        # light colours back over dark mode's; the tree is created with them
+        # (validation_tab) and DarkModeManager.update_tree_tags owns them after.
+        #
+        # The rows go in with ONE call to TREE_INSERT_PROC. tree.insert per row
+        # was a Python -> Tcl round trip each, plus tkinter's option formatting,
+        # for every client on every rescan.
+        xscroll = tree.cget('xscrollcommand')
+        yscroll = tree.cget('yscrollcommand')
+        tree.configure(xscrollcommand='', yscrollcommand='')
+        try:
+            tree.delete(*tree.get_children())
+            self._fit_columns(rows)
+            batch = []
+            for _client_key, values, tags in rows:
+                batch += ['☐', values, tags]
+            items = tree.tk.splitlist(
+                tree.tk.call('::gst_tree_insert', tree, tuple(batch)))
+            for item, (client_key, _values, tags) in zip(items, rows):
+                self.app.selected_clients[item] = False
+                self._item_keys[item] = client_key
+                if tags is COMPLETE_TAGS:
+                    self._complete_items.add(item)
+                
+                # Initialize folder name setting
+                self.app.client_folder_settings[client_key] = False
+        finally:
+            tree.configure(xscrollcommand=xscroll, yscrollcommand=yscroll)
         
-        # Select first item if exists
-        children = self.app.client_tree.get_children()
-        if children:
-            self.app.client_tree.selection_set(children[0])
-            self.app.client_tree.focus(children[0])
+        # Select first item if exists. Taken from the ids the insert returned:
+        # get_children() would list every row again just to read the first.
+        first = next(iter(self._item_keys), None)
+        if first is not None:
+            tree.selection_set(first)
+            tree.focus(first)
+    
+    def _fit_columns(self, rows):
+        """Widen data columns to fit their longest value, measured once per
+        column before any row is inserted. Columns never shrink below their
+        layout width, and are capped so one long name cannot push the rest of
+        the table out of view."""
+        tree = self.app.client_tree
+        try:
+            font = tkfont.nametofont('TkDefaultFont')
+        except Exception:
+            return
+        columns = tree['columns']
+        for index, (column_id, base_width, _minwidth, _title) in enumerate(
+                CLIENT_TREE_COLUMNS[1:]):
+            if index >= len(columns):
+                break
+            # Every value is already text, so no str() per cell.
+            longest = max((values[index] for _key, values, _tags in rows),
+                          key=len, default='')
+            width = min(max(base_width, font.measure(longest) + FIT_PADDING_PX),
+                        FIT_MAX_WIDTH_PX)
+            # A rescan usually fits the columns to the widths they already
+            # have; re-setting one still relays out the whole tree.
+            if self._column_widths.get(column_id) != width:
+                tree.column(column_id, width=width)
+                self._column_widths[column_id] = width
     
     def on_client_click(self, event):
         """Handle client tree click"""
-        region = self.app.client_tree.identify_region(event.x, event.y)
-        column = self.app.client_tree.identify_column(event.x)
+        tree = self.app.client_tree
+        # Clicks on the headings, separators or empty space do nothing; settle
+        # that first, before asking Tk for the row and column as well.
+        region = tree.identify_region(event.x, event.y)
+        if region not in ('tree', 'cell'):
+            return
+        item = tree.identify_row(event.y)
+        if not item:
+            return
         
         if region == 'tree':
-            item = self.app.client_tree.identify_row(event.y)
-            if item:
-                self.toggle_client_selection(item)
-        elif region == 'cell' and column == '#7':  # FolderName column
-            item = self.app.client_tree.identify_row(event.y)
-            if item:
-                self.toggle_folder_name_setting(item)
+            self.toggle_client_selection(item)
+        elif tree.identify_column(event.x) == '#7':  # FolderName column
+            self.toggle_folder_name_setting(item)
     
     def on_space_key(self, event):
         """Handle space key for selection"""
@@ -132,53 +245,58 @@ class ClientHandler:
     
     def select_all_clients(self):
         """Select all clients"""
-        for item in self.app.client_tree.get_children():
-            self.app.selected_clients[item] = True
-            self.app.client_tree.item(item, text='☑')
+        self._set_checks(self.app.client_tree.get_children(), True)
         self.app.update_status(f"Selected all {len(self.app.client_data)} clients")
     
     def clear_all_clients(self):
         """Clear all selections"""
-        for item in self.app.client_tree.get_children():
-            self.app.selected_clients[item] = False
-            self.app.client_tree.item(item, text='☐')
+        self._set_checks(self.app.client_tree.get_children(), False)
         self.app.update_status("Cleared all selections")
     
     def select_complete_clients(self):
         """Select only complete clients"""
-        count = 0
+        complete, other = [], []
         for item in self.app.client_tree.get_children():
-            values = self.app.client_tree.item(item)['values']
-            if 'Complete' in str(values[2]):
-                self.app.selected_clients[item] = True
-                self.app.client_tree.item(item, text='☑')
-                count += 1
-            else:
-                self.app.selected_clients[item] = False
-                self.app.client_tree.item(item, text='☐')
-        self.app.update_status(f"Selected {count} complete clients")
+            (complete if item in self._complete_items else other).append(item)
+        self._set_checks(complete, True)
+        self._set_checks(other, False)
+        self.app.update_status(f"Selected {len(complete)} complete clients")
+    
+    def _set_checks(self, items, checked):
+        """Mark rows selected or not, redrawing their check boxes in one call.
+
+        Setting each row's text with tree.item was a Tcl round trip per row, so
+        Select All cost one per client. Rows already in the wanted state are
+        left alone: Select Complete, say, usually only changes a few.
+        """
+        selected = self.app.selected_clients
+        items = [item for item in items if selected.get(item) != checked]
+        for item in items:
+            selected[item] = checked
+        if items:
+            tree = self.app.client_tree
+            tree.tk.call('::gst_tree_set_text', tree, tuple(items),
+                         '☑' if checked else '☐')
     
     def get_selected_clients(self):
         """Get list of selected clients"""
-        selected = []
-        
-        for item, is_selected in self.app.selected_clients.items():
-            if is_selected:
-                values = self.app.client_tree.item(item)['values']
-                # Convert state name to state code for consistent key
-                state_code = get_state_code(values[1])
-                client_key = f"{values[0]}-{state_code}"
-                selected.append(client_key)
-        
-        return selected
+        # Keys recorded when the rows were inserted. Rebuilding them from the
+        # row values read each selected row back out of the tree - and Tk hands
+        # numeric-looking values back as numbers, so a client named '007' came
+        # back as 7 and its key did not match.
+        return [self._item_keys[item]
+                for item, is_selected in self.app.selected_clients.items()
+                if is_selected]
     
     def toggle_folder_name_setting(self, item):
         """Toggle folder name setting for a client"""
-        values = list(self.app.client_tree.item(item)['values'])
-        # Key by state CODE (values[1] is the state NAME) so it matches the key
-        # FileOrganizer reads (client-STATECODE) and get_selected_clients builds.
-        # Keying by name here meant per-client toggles were silently ignored.
-        client_key = f"{values[0]}-{get_state_code(values[1])}"
+        # The key recorded for the row is client-STATECODE, the key
+        # FileOrganizer reads. It was rebuilt from the row's values before,
+        # which read every cell back out of the tree and rewrote them all to
+        # change one - turning a numeric-looking client name such as '007'
+        # into 7 on screen.
+        client_key = self._item_keys[item]
+        name = self.app.client_data[client_key]['client']
         
         # Toggle the setting
         current = self.app.client_folder_settings.get(client_key, False)
@@ -186,19 +304,19 @@ class ClientHandler:
         
         # Update display
         if self.app.client_folder_settings[client_key]:
-            values[6] = '☑ Yes'
+            shown = FOLDER_NAME_ON
             # Check name length
-            if len(values[0]) > 10:
+            if len(name) > 10:
                 response = messagebox.askyesno(
                     "Long Client Name Warning",
-                    f"Client name '{values[0]}' has {len(values[0])} characters.\n\n"
+                    f"Client name '{name}' has {len(name)} characters.\n\n"
                     "This will create long folder names. Continue?"
                 )
                 if not response:
                     self.app.client_folder_settings[client_key] = False
-                    values[6] = '☐ No'
+                    shown = FOLDER_NAME_OFF
         else:
-            values[6] = '☐ No'
+            shown = FOLDER_NAME_OFF
             # If unchecking and global is ON, turn off global
             if self.app.include_client_name_in_folders.get():
                 self.app.include_client_name_in_folders.set(False)
@@ -206,19 +324,20 @@ class ClientHandler:
                                 "Global folder name setting has been turned off\n"
                                 "since you unchecked an individual client.")
         
-        self.app.client_tree.item(item, values=values)
+        self.app.client_tree.set(item, FOLDER_NAME_COLUMN, shown)
     
     def update_global_folder_setting(self):
         """Update all client folder settings when global checkbox changes"""
         if self.app.include_client_name_in_folders.get():
-            # Global is ON - update all individual settings to Yes
-            for item in self.app.client_tree.get_children():
-                values = list(self.app.client_tree.item(item)['values'])
-                # Key by state CODE to match FileOrganizer / get_selected_clients.
-                client_key = f"{values[0]}-{get_state_code(values[1])}"
-                self.app.client_folder_settings[client_key] = True
-                values[6] = '☑ Yes'
-                self.app.client_tree.item(item, values=values)
+            # Global is ON - update all individual settings to Yes, and the
+            # rows' Name column in one call.
+            tree = self.app.client_tree
+            items = tree.get_children()
+            for item in items:
+                self.app.client_folder_settings[self._item_keys[item]] = True
+            if items:
+                tree.tk.call('::gst_tree_set_cell', tree, items,
+                             FOLDER_NAME_COLUMN, FOLDER_NAME_ON)
         # Don't change individual settings when global is turned OFF
         self.app.save_cache()
     
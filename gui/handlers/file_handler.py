@@ -9,6 +9,9 @@ from utils.helpers import truncate_path
 
 logger = logging.getLogger(__name__)
 
+# File types offered when picking an ITC or Sales template.
+TEMPLATE_FILETYPES = (("Excel Template", "*.xltx *.xlsx"),)
+
 
 class FileHandler:
     """Handles file browsing, scanning, and validation"""
@@ -26,24 +29,21 @@ class FileHandler:
     
     def browse_itc_template(self):
         """Browse for ITC template"""
-        file = filedialog.askopenfilename(
-            title="Select ITC Template",
-            filetypes=[("Excel Template", "*.xltx *.xlsx")]
-        )
-        if file:
-            self.app.itc_template.set(file)
-            self.app.update_status(f"ITC template selected")
-            self.app.save_cache()
+        self._browse_template("ITC", self.app.itc_template)
     
     def browse_sales_template(self):
         """Browse for Sales template"""
+        self._browse_template("Sales", self.app.sales_template)
+    
+    def _browse_template(self, kind, variable):
+        """Ask for a template file and store it in `variable`"""
         file = filedialog.askopenfilename(
-            title="Select Sales Template",
-            filetypes=[("Excel Template", "*.xltx *.xlsx")]
+            title=f"Select {kind} Template",
+            filetypes=TEMPLATE_FILETYPES
         )
         if file:
-            self.app.sales_template.set(file)
-            self.app.update_status(f"Sales template selected")
+            variable.set(file)
+            self.app.update_status(f"{kind} template selected")
             self.app.save_cache()
     
     def browse_target_folder(self):
@@ -106,13 +106,11 @@ class FileHandler:
         
         # Clear displays
         if hasattr(self.app, 'summary_text'):
-            self.app.summary_text.config(state='normal')
-            self.app.summary_text.delete(1.0, 'end')
-            self.app.summary_text.config(state='disabled')
+            self.app.validation_tab.set_summary('')
         
         if hasattr(self.app, 'client_tree'):
-            for item in self.app.client_tree.get_children():
-                self.app.client_tree.delete(item)
+            # One delete for every row, not a Tcl call and relayout per row.
+            self.app.client_tree.delete(*self.app.client_tree.get_children())
         
         # Re-scan
         self.scan_files()
@@ -21,19 +21,33 @@ class ProcessingHandler:
         self.app = app_instance
 
     def _log_async(self, message, level='normal'):
-        """Schedule a log message on the UI thread.
+        """Log from the worker thread.
 
-        The message is formatted by the caller and captured HERE via a default
-        argument, so loop variables (client_info, folders, result, ...) are read
-        at schedule time - not later when the callback runs, by which point the
-        loop may have moved on. Fixes wrong client names appearing in the log.
+        The message is formatted by the caller, so loop variables (client_info,
+        folders, result, ...) are read at call time - not later when the line is
+        drawn, by which point the loop may have moved on. Fixes wrong client
+        names appearing in the log.
+
+        app.log_message queues the line and draws it on the UI thread, so it is
+        called directly: wrapping each line in after(0) first cost a blocking
+        hop to the UI thread per line, for a call that is already thread-safe.
         """
-        self.app.root.after(0, lambda m=message, lv=level: self.app.log_message(m, lv))
+        self.app.log_message(message, level)
+
+    def _ui(self, func, *args, **kwargs):
+        """Run `func` on the UI thread. Tk is not thread-safe, so the worker must
+        not touch widgets or open dialogs itself; arguments are bound now."""
+        self.app.root.after(0, lambda: func(*args, **kwargs))
 
     def _progress_async(self, progress, message):
-        """Schedule a progress update on the UI thread, capturing the values now
-        (same reason as _log_async)."""
-        self.app.root.after(0, lambda p=progress, m=message: self.app.update_progress(p, m))
+        """Report progress from the worker thread.
+
+        app.update_progress is itself safe from any thread and keeps only the
+        latest value, so it is called directly: going through after(0) first
+        added a UI callback per report, and could land an earlier value after
+        a later direct call.
+        """
+        self.app.update_progress(progress, message)
 
     def dry_run(self):
         """Perform dry run"""
@@ -68,10 +82,10 @@ class ProcessingHandler:
     
     def start_processing(self):
         """Start processing selected clients"""
-        # Re-entrancy guard. The Start button is bound with .bind('<Button-1>'),
-        # which still fires even when the button is visually 'disabled', so a
-        # click during a run could launch a SECOND worker thread. Bail out if a
-        # run is already in progress.
+        # Re-entrancy guard. Step 3's Start button is disabled during a run, but
+        # Step 2 has its own START button that is not, so a click there during a
+        # run could launch a SECOND worker thread. Bail out if a run is already
+        # in progress.
         if getattr(self.app, 'is_processing', False):
             return
 
@@ -139,11 +153,12 @@ class ProcessingHandler:
         Switches to the tab and scans it so the client list is ready, but does
         NOT start the refresh: that drives Excel for many minutes per report, so
         it stays an explicit press. In 'organize' mode nothing happens here -
-        Step 4 is still there whenever the user wants it.
+        Step 4 is still there whenever the user wants it. UI thread only (see
+        _finish_processing).
         """
         try:
             if self.app.workflow_mode.get() != 'full':
-                self._log_async(
+                self.app.log_message(
                     "ℹ️ Workflow is 'organise only'. Open Step 4 if you also want "
                     "to refresh Power Query.", 'info')
                 return
@@ -154,9 +169,30 @@ class ProcessingHandler:
         if extract_tab is None:
             return
 
-        self._log_async("\n🔄 Full pipeline: moving to Step 4 to extract…", 'info')
-        # Marshal to the UI thread - this runs on the worker thread.
-        self.app.root.after(0, self._open_extraction_tab)
+        self.app.log_message("\n🔄 Full pipeline: moving to Step 4 to extract…", 'info')
+        self._open_extraction_tab()
+
+    def _finish_processing(self, message, level1_folder):
+        """Show the completion dialog, then open the output folder and continue
+        to Step 4 (UI thread only)."""
+        messagebox.showinfo("Processing Complete", message)
+
+        # Open the output folder
+        if level1_folder:
+            try:
+                if platform.system() == 'Windows':
+                    os.startfile(level1_folder)
+                elif platform.system() == 'Darwin':  # macOS
+                    os.system(f'open "{level1_folder}"')
+                else:  # Linux
+                    os.system(f'xdg-open "{level1_folder}"')
+
+                self.app.log_message(f"📂 Opened output folder", 'success')
+            except Exception as e:
+                self.app.log_message(f"Could not open folder: {e}", 'warning')
+
+        # Full pipeline: continue into Step 4 automatically.
+        self._maybe_continue_to_extraction()
 
     def _open_extraction_tab(self):
         """Select Step 4 and scan it (UI thread only)."""
@@ -495,36 +531,23 @@ class ProcessingHandler:
             seconds = int(duration.total_seconds() % 60)
             self.app.log_message(f"\n⏱️ Total processing time: {minutes} minutes {seconds} seconds", 'info')
 
-            messagebox.showinfo(
-                "Processing Complete",
+            # One UI-thread callback for the whole wrap-up. showinfo used to
+            # block this worker until it was dismissed, so the folder and Step 4
+            # only opened afterwards; posting them separately ran them behind
+            # the dialog, inside its modal loop.
+            self._ui(
+                self._finish_processing,
                 f"Successfully processed {processed}/{total_clients} clients\n\n"
-                f"Files organized in:\n{self.app.target_folder.get()}"
+                f"Files organized in:\n{self.app.target_folder.get()}",
+                level1_folder,
             )
 
-            # Open the output folder
-            if level1_folder:
-                try:
-                    if platform.system() == 'Windows':
-                        os.startfile(level1_folder)
-                    elif platform.system() == 'Darwin':  # macOS
-                        os.system(f'open "{level1_folder}"')
-                    else:  # Linux
-                        os.system(f'xdg-open "{level1_folder}"')
-                
-                    self.app.log_message(f"📂 Opened output folder", 'success')
-                except Exception as e:
-                    self.app.log_message(f"Could not open folder: {e}", 'warning')
-
-            # Full pipeline: continue into Step 4 automatically.
-            self._maybe_continue_to_extraction()
-
-
         except Exception as e:
             self.app.log_message(f"💥 Fatal error: {str(e)}", 'error')
             logger.error(f"Processing error: {str(e)}", exc_info=True)
-            messagebox.showerror("Processing Error", str(e))
+            self._ui(messagebox.showerror, "Processing Error", str(e))
             
         finally:
             self.app.is_processing = False
-            self.app.start_btn.config(state='normal')
-            self.app.stop_btn.config(state='disabled')
\ No newline at end of file
+            self._ui(self.app.start_btn.config, state='normal')
+            self._ui(self.app.stop_btn.config, state='disabled')
\ No newline at end of file
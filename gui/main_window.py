@@ -6,6 +6,7 @@ Modularized version - ties all components together
 
 import os
 import sys
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 from pathlib import Path
@@ -32,7 +33,7 @@ from .handlers.client_handler import ClientHandler
 from .handlers.processing_handler import ProcessingHandler
 from .utils.dark_mode_manager import DarkModeManager
 from .utils.cache_manager import CacheManager
-from .utils.ui_helpers import UIHelpers
+from .utils.ui_helpers import UIHelpers, LOG_FLUSH_MS
 from .utils.status_bar import StatusBar
 
 logger = logging.getLogger(__name__)
@@ -102,6 +103,9 @@ class GSTOrganizerApp:
         self.is_processing = False
         self.stop_requested = False
         self.processing_thread = None
+        # Latest progress not yet drawn; see update_progress.
+        self._pending_progress = None
+        self._progress_lock = threading.Lock()
         
         # GUI references
         self.widgets = {}
@@ -156,23 +160,16 @@ class GSTOrganizerApp:
     # Dark mode methods
     def toggle_dark_mode(self):
         """Toggle dark mode on/off"""
+        # Already in the requested mode: nothing to do. Without this a repeat
+        # call re-walked every widget, recoloured the tree tags,
+        # and rewrote the settings file, all to arrive where it started.
+        if bool(self.dark_mode.get()) == self.dark_mode_manager.is_dark_mode:
+            return
         if self.dark_mode.get():
             self.dark_mode_manager.apply_dark_mode()
         else:
             self.dark_mode_manager.restore_original_colors()
         
-        # Update special widgets
-        if hasattr(self, 'title_bar'):
-            # Restore title frame color
-            if not self.dark_mode.get() and hasattr(self.title_bar, 'title_frame'):
-                self.title_bar.title_frame.configure(bg=GUI_CONFIG['colors']['primary'])
-                # Update all children of title frame
-                for widget in self.title_bar.title_frame.winfo_children():
-                    try:
-                        widget.configure(bg=GUI_CONFIG['colors']['primary'])
-                    except:
-                        pass
-        
         # Update tree tags
         if hasattr(self, 'client_tree'):
             self.dark_mode_manager.update_tree_tags(self.client_tree, self.dark_mode.get())
@@ -285,11 +282,25 @@ class GSTOrganizerApp:
         UIHelpers.log_message(self.log_text, message, level)
     
     def update_progress(self, value, message):
-        """Update progress display"""
-        self.root.after(0, lambda: UIHelpers.update_progress(
-            self.progress_var, self.progress_label, 
-            self.current_operation, value, message
-        ))
+        """Update progress display (safe from any thread).
+
+        The worker reports progress per file, far faster than anyone can read
+        it, and each report was its own UI callback redrawing three widgets.
+        Only the latest value is kept; the first report of a burst schedules
+        one draw LOG_FLUSH_MS later, in step with the log.
+        """
+        with self._progress_lock:
+            first = self._pending_progress is None
+            self._pending_progress = (value, message)
+        if first:
+            self.root.after(LOG_FLUSH_MS, self._flush_progress)
+
+    def _flush_progress(self):
+        with self._progress_lock:
+            value, message = self._pending_progress
+            self._pending_progress = None
+        UIHelpers.update_progress(self.progress_var, self.progress_label,
+                                  self.current_operation, value, message)
     
     def update_summary(self):
         """Update summary display"""
@@ -298,7 +309,7 @@ class GSTOrganizerApp:
         
         stats = self.file_parser.get_statistics()
         
-        summary = f"""📊 SCAN RESULTS SUMMARY:
+        lines = [f"""📊 SCAN RESULTS SUMMARY:
 ════════════════════════════════════════════
 📁 FILES ANALYSIS:
    Total Excel Files Found: {stats['total_files']}
@@ -312,20 +323,17 @@ class GSTOrganizerApp:
    ⚠️ Clients with Missing Files: {stats['incomplete_clients']}
    📈 Completeness Rate: {stats['completion_rate']:.1f}%
 
-📋 FILE TYPE DISTRIBUTION:"""
+📋 FILE TYPE DISTRIBUTION:"""]
         
         for file_type, count in stats['file_type_distribution'].items():
-            summary += f"\n   • {file_type}: {count} files"
+            lines.append(f"   • {file_type}: {count} files")
         
         if self.variations:
-            summary += f"\n\n🔍 FILE VARIATIONS: {len(self.variations)} files"
+            lines.append(f"\n🔍 FILE VARIATIONS: {len(self.variations)} files")
         
-        summary += f"\n\n💾 TOTAL DATA SIZE: {stats['total_size_formatted']}"
+        lines.append(f"\n💾 TOTAL DATA SIZE: {stats['total_size_formatted']}")
         
-        self.summary_text.config(state='normal')
-        self.summary_text.delete(1.0, tk.END)
-        self.summary_text.insert(1.0, summary)
-        self.summary_text.config(state='disabled')
+        self.validation_tab.set_summary('\n'.join(lines))
     
     # Event handlers
     def on_tab_changed(self, event):
@@ -4,6 +4,23 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 from utils.constants import GUI_CONFIG
+from ..utils.ui_helpers import UIHelpers
+
+# Log console styling, defined once here rather than spelled out at each
+# widget: a dark console with one foreground colour per log level. 'normal'
+# lines are inserted untagged and take LOG_FG (see UIHelpers.log_message).
+LOG_FONT = ('Consolas', 9)
+LOG_BG = '#1E1E1E'
+LOG_FG = '#FFFFFF'
+LOG_LEVEL_COLORS = {
+    'success': '#4CAF50',
+    'warning': '#FF9800',
+    'error': '#F44336',
+    'info': '#2196F3',
+}
+
+PROGRESS_LABEL_FONT = ('Arial', 11, 'bold')
+OPERATION_FONT = ('Arial', 10)
 
 
 class ProcessingTab:
@@ -20,17 +37,11 @@ class ProcessingTab:
         self.notebook.add(self.tab_frame, text="🚀 Step 3: Processing")
         
         # Progress section
-        progress_frame = tk.Frame(self.tab_frame, bg='white', relief='solid', borderwidth=2)
+        progress_frame = UIHelpers.make_card(self.tab_frame)
         progress_frame.pack(fill='x', padx=20, pady=20)
         
-        header = tk.Frame(progress_frame, bg=GUI_CONFIG['colors']['primary'], height=40)
-        header.pack(fill='x')
-        header.pack_propagate(False)
-        
-        tk.Label(header, text="📊 PROCESSING PROGRESS",
-                font=('Arial', 12, 'bold'),
-                bg=GUI_CONFIG['colors']['primary'],
-                fg='white').pack(expand=True)
+        UIHelpers.create_section_header(progress_frame, "📊 PROCESSING PROGRESS",
+                                        GUI_CONFIG['colors']['primary'])
         
         content_frame = tk.Frame(progress_frame, bg='white')
         content_frame.pack(fill='x', padx=20, pady=20)
@@ -45,14 +56,14 @@ class ProcessingTab:
         # Progress label
         self.app.progress_label = tk.Label(content_frame,
                                      text="⏳ Ready to start...",
-                                     font=('Arial', 11, 'bold'),
+                                     font=PROGRESS_LABEL_FONT,
                                      bg='white',
                                      fg=GUI_CONFIG['colors']['dark'])
         self.app.progress_label.pack(anchor='w', pady=(0, 5))
         
         self.app.current_operation = tk.Label(content_frame,
                                         text="",
-                                        font=('Arial', 10),
+                                        font=OPERATION_FONT,
                                         bg='white',
                                         fg=GUI_CONFIG['colors']['primary'])
         self.app.current_operation.pack(anchor='w')
@@ -61,57 +72,36 @@ class ProcessingTab:
         control_frame = tk.Frame(content_frame, bg='white')
         control_frame.pack(fill='x', pady=(15, 0))
         
-        self.app.start_btn = tk.Button(control_frame,
-                                 text="🚀 START PROCESSING",
-                                 font=('Arial', 10, 'bold'),
-                                 bg=GUI_CONFIG['colors']['success'],
-                                 fg='white',
-                                 relief='flat',
-                                 padx=20, 
-                                 pady=8,
-                                 cursor='hand2')
+        self.app.start_btn = UIHelpers.make_button(
+            control_frame, "🚀 START PROCESSING", self.app.start_processing,
+            GUI_CONFIG['colors']['success'], pad=(20, 8))
         self.app.start_btn.pack(side='left', padx=5)
-        self.app.start_btn.bind('<Button-1>', lambda e: self.app.start_processing())
         
-        self.app.stop_btn = tk.Button(control_frame,
-                                text="⏹ STOP",
-                                font=('Arial', 10, 'bold'),
-                                bg=GUI_CONFIG['colors']['danger'],
-                                fg='white',
-                                relief='flat',
-                                padx=20, 
-                                pady=8,
-                                state='disabled',
-                                cursor='hand2')
+        self.app.stop_btn = UIHelpers.make_button(
+            control_frame, "⏹ STOP", self.app.stop_processing,
+            GUI_CONFIG['colors']['danger'], pad=(20, 8), state='disabled')
         self.app.stop_btn.pack(side='left', padx=5)
-        self.app.stop_btn.bind('<Button-1>', lambda e: self.app.stop_processing())
         
         # Log section
-        log_frame = tk.Frame(self.tab_frame, bg='white', relief='solid', borderwidth=2)
+        log_frame = UIHelpers.make_card(self.tab_frame)
         log_frame.pack(fill='both', expand=True, padx=20, pady=(0, 20))
         
-        header = tk.Frame(log_frame, bg=GUI_CONFIG['colors']['success'], height=40)
-        header.pack(fill='x')
-        header.pack_propagate(False)
-        
-        tk.Label(header, text="📝 PROCESSING LOG",
-                font=('Arial', 12, 'bold'),
-                bg=GUI_CONFIG['colors']['success'],
-                fg='white').pack(expand=True)
+        UIHelpers.create_section_header(log_frame, "📝 PROCESSING LOG",
+                                        GUI_CONFIG['colors']['success'])
         
-        # Log text with colors
+        # Log text with colors. undo=False is Tk's default, stated so it stays
+        # that way: with an undo stack, every line appended to this read-only
+        # log would also be recorded there, for the whole run.
         self.app.log_text = scrolledtext.ScrolledText(log_frame,
                                                  height=18,
-                                                 font=('Consolas', 9),
-                                                 bg='#1E1E1E',
-                                                 fg='#FFFFFF',
+                                                 font=LOG_FONT,
+                                                 bg=LOG_BG,
+                                                 fg=LOG_FG,
                                                  state='disabled',
+                                                 undo=False,
                                                  wrap=tk.WORD)
         self.app.log_text.pack(fill='both', expand=True, padx=15, pady=15)
         
         # Configure log tags
-        self.app.log_text.tag_configure('success', foreground='#4CAF50')
-        self.app.log_text.tag_configure('warning', foreground='#FF9800')
-        self.app.log_text.tag_configure('error', foreground='#F44336')
-        self.app.log_text.tag_configure('info', foreground='#2196F3')
-        self.app.log_text.tag_configure('normal', foreground='#FFFFFF')
\ No newline at end of file
+        for level, color in LOG_LEVEL_COLORS.items():
+            self.app.log_text.tag_configure(level, foreground=color)
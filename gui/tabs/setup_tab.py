@@ -10,12 +10,13 @@ without Tkinter. Existence checks are debounced and cached because on a network
 share each one is a real round-trip.
 """
 
+import re
 import tkinter as tk
 from pathlib import Path
 from tkinter import ttk
 
 from utils.constants import (
-    FILE_PATTERNS, GUI_CONFIG, PROCESSING_MODES, WORKFLOW_MODES,
+    FILE_PATTERNS, GUI_CONFIG, PROCESSING_MODE_CHOICES, WORKFLOW_MODES,
 )
 from ..utils.ui_helpers import UIHelpers
 from ..utils import setup_validation as sv
@@ -134,6 +135,12 @@ RESCAN_HELP = (
 
 REVALIDATE_DELAY_MS = 350   # debounce: avoid stat'ing a UNC path on every keystroke
 
+# Keystroke filter for the name-length spinbox: empty (mid-edit) or 1-100. The
+# 15..100 range itself is enforced when editing finishes - checking it per key
+# would reject the "2" on the way to typing "25".
+LENGTH_KEY_RE = re.compile(r'^(|[1-9]\d?|100)$')
+LENGTH_MIN, LENGTH_MAX, LENGTH_DEFAULT = 15, 100, 35
+
 SCROLL_STEP_PX = 22         # pixels per scroll unit
 SCROLL_UNITS_PER_NOTCH = 3  # a wheel notch moves 3 units (~= 3 text lines)
 
@@ -150,22 +157,31 @@ class SetupTab:
         self._exists_cache = {}
         self._canvas = None
         self._wheel_accum = 0.0
+        self._wheel_job = None      # pending after_idle flush of _wheel_accum
+        self._scrollregion_job = None
         self._accent_bars = []      # (widget, colour) to repaint per theme
         self.create_tab()
         self._attach_traces()
         self.refresh_status(force=True)
 
     # ------------------------------------------------------------------ setup
+    def _font(self, *spec):
+        """The tab's fonts as shared named fonts (see UIHelpers.named_font)."""
+        return UIHelpers.named_font(self.app.root, spec)
+
     def create_tab(self):
         self.tab_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.tab_frame, text="📁 Step 1: Setup")
 
         canvas = tk.Canvas(self.tab_frame, bg=COLORS['light'], highlightthickness=0)
+        self._canvas = canvas
         scrollbar = ttk.Scrollbar(self.tab_frame, orient='vertical', command=canvas.yview)
         scrollable = tk.Frame(canvas, bg=COLORS['light'])
 
-        scrollable.bind('<Configure>',
-                        lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
+        # Every child resize bubbles up as a <Configure> here - dozens while the
+        # tab is being built. Recompute the scroll region once per idle cycle
+        # instead of walking bbox('all') for each of them.
+        scrollable.bind('<Configure>', self._schedule_scrollregion)
         window_id = canvas.create_window((0, 0), window=scrollable, anchor='nw')
         canvas.bind('<Configure>',
                     lambda e: canvas.itemconfigure(window_id, width=e.width))
@@ -185,7 +201,6 @@ class SetupTab:
         canvas.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
 
-        self._canvas = canvas
         # A predictable step size: without this, 'units' scrolling depends on an
         # implementation-defined default and feels inconsistent.
         canvas.configure(yscrollincrement=SCROLL_STEP_PX)
@@ -201,6 +216,17 @@ class SetupTab:
         canvas.bind_all('<MouseWheel>', self._on_mousewheel, add='+')
 
     # --------------------------------------------------------------- scrolling
+    def _schedule_scrollregion(self, _event=None):
+        if self._scrollregion_job is None and self._canvas is not None:
+            self._scrollregion_job = self._canvas.after_idle(self._update_scrollregion)
+
+    def _update_scrollregion(self):
+        self._scrollregion_job = None
+        try:
+            self._canvas.configure(scrollregion=self._canvas.bbox('all'))
+        except tk.TclError:
+            pass                      # tab destroyed before the update ran
+
     def _is_dark(self):
         """Whether the app is currently in dark mode (safe if unavailable)."""
         try:
@@ -221,16 +247,18 @@ class SetupTab:
         canvas = self._canvas
         if canvas is None:
             return None
-        try:
-            if not canvas.winfo_exists():
-                return None
-        except tk.TclError:
-            return None
 
         # Application-level binding: ignore wheel events aimed at other tabs or
         # at widgets that scroll themselves (the log box, comboboxes, ...).
+        # Checked first because it is pure Python - wheel events over the other
+        # tabs leave here without a single Tcl round-trip.
         if not self._is_in_scroll_area(event.widget):
             return None
+        try:
+            if not canvas.winfo_exists():
+                return None
+        except tk.TclError:
+            return None
 
         # Nothing to scroll - let the event through rather than swallowing it.
         first, last = canvas.yview()
@@ -241,12 +269,26 @@ class SetupTab:
         # touchpads send deltas smaller than 120, which int(delta/120) would
         # truncate to 0 - making the wheel appear dead.
         self._wheel_accum += -event.delta / 120.0 * SCROLL_UNITS_PER_NOTCH
-        steps = int(self._wheel_accum)
-        if steps:
-            self._wheel_accum -= steps
-            canvas.yview_scroll(steps, 'units')
+
+        # Scroll once per idle cycle rather than once per event. A fast trackpad
+        # sends dozens of events between repaints; each scrolled (and redrew)
+        # the whole tab separately.
+        if self._wheel_job is None:
+            self._wheel_job = canvas.after_idle(self._flush_wheel)
         return 'break'
 
+    def _flush_wheel(self):
+        """Apply every wheel step accumulated since the last idle cycle."""
+        self._wheel_job = None
+        steps = int(self._wheel_accum)
+        if not steps:
+            return
+        self._wheel_accum -= steps
+        try:
+            self._canvas.yview_scroll(steps, 'units')
+        except tk.TclError:
+            pass                      # tab destroyed before the flush ran
+
     def _accent_card(self, parent, accent, pady=(0, 12)):
         """A white card with a coloured accent bar down its left edge."""
         outer = tk.Frame(parent, bg=CARD_BORDER, relief='flat', borderwidth=0,
@@ -265,24 +307,24 @@ class SetupTab:
         row = tk.Frame(card, bg='white')
         row.pack(fill='x', padx=16, pady=(12, 4))
 
-        tk.Label(row, text="📁  Step 1 — Setup", font=('Segoe UI', 15, 'bold'),
+        tk.Label(row, text="📁  Step 1 — Setup", font=self._font('Segoe UI', 15, 'bold'),
                  bg='white', fg=COLORS['primary']).pack(side='left')
 
         # Coloured readiness pill, updated by refresh_status
-        self.summary_label = tk.Label(row, text="", font=('Segoe UI', 9, 'bold'),
+        self.summary_label = tk.Label(row, text="", font=self._font('Segoe UI', 9, 'bold'),
                                       bg='#F1F3F4', fg='#5F6368', padx=10, pady=3)
         self.summary_label.pack(side='right')
 
         tk.Label(card,
                  text="Choose where your GST files are, the two report templates, "
                       "and where the organised output should go.",
-                 font=('Segoe UI', 9), bg='white', fg='#5F6368',
+                 font=self._font('Segoe UI', 9), bg='white', fg='#5F6368',
                  justify='left', anchor='w').pack(fill='x', padx=16, pady=(0, 12))
 
     def _create_checklist(self, parent):
         card = self._accent_card(parent, COLORS['info'])
 
-        tk.Label(card, text="CHECKLIST", font=('Segoe UI', 9, 'bold'),
+        tk.Label(card, text="CHECKLIST", font=self._font('Segoe UI', 9, 'bold'),
                  bg='white', fg=COLORS['info'], anchor='w').pack(
                      fill='x', padx=16, pady=(10, 6))
 
@@ -297,15 +339,15 @@ class SetupTab:
             row = tk.Frame(holder, bg='#F1F3F4')
             row.pack(fill='x', pady=2)
 
-            icon = tk.Label(row, text='○', font=('Segoe UI', 12, 'bold'),
+            icon = tk.Label(row, text='○', font=self._font('Segoe UI', 12, 'bold'),
                             bg='#F1F3F4', fg='#8A8F98', width=3)
             icon.pack(side='left', pady=5)
 
-            name = tk.Label(row, text=f"{emoji}  {label}", font=('Segoe UI', 10, 'bold'),
+            name = tk.Label(row, text=f"{emoji}  {label}", font=self._font('Segoe UI', 10, 'bold'),
                             bg='#F1F3F4', fg=accent, width=20, anchor='w')
             name.pack(side='left', pady=5)
 
-            detail = tk.Label(row, text='', font=('Segoe UI', 9), bg='#F1F3F4',
+            detail = tk.Label(row, text='', font=self._font('Segoe UI', 9), bg='#F1F3F4',
                               fg='#5F6368', anchor='w')
             detail.pack(side='left', fill='x', expand=True, pady=5)
 
@@ -317,7 +359,7 @@ class SetupTab:
         """How far the run should go: reports only, or the full pipeline."""
         card = self._accent_card(parent, COLORS['warning'])
 
-        tk.Label(card, text="WHAT SHOULD THIS RUN DO?", font=('Segoe UI', 9, 'bold'),
+        tk.Label(card, text="WHAT SHOULD THIS RUN DO?", font=self._font('Segoe UI', 9, 'bold'),
                  bg='white', fg='#8A5300', anchor='w').pack(
                      fill='x', padx=16, pady=(10, 6))
 
@@ -329,19 +371,19 @@ class SetupTab:
             block.pack(fill='x', pady=2)
             radio = tk.Radiobutton(block, text=info['name'],
                            variable=self.app.workflow_mode, value=key,
-                           font=('Segoe UI', 10, 'bold'), bg='white',
+                           font=self._font('Segoe UI', 10, 'bold'), bg='white',
                            fg=COLORS['dark'], anchor='w',
                            command=self._on_workflow_change)
             radio.pack(anchor='w')
             Tooltip(radio, WORKFLOW_HELP.get(key, info['description']))
             tk.Label(block, text=f"     {info['description']}",
-                     font=('Segoe UI', 9), bg='white', fg='#5F6368',
+                     font=self._font('Segoe UI', 9), bg='white', fg='#5F6368',
                      anchor='w').pack(fill='x')
 
         tk.Label(holder,
                  text="Step 4 stays available either way - this only decides whether "
                       "Step 3 continues into it automatically.",
-                 font=('Segoe UI', 8, 'italic'), bg='white', fg='#5F6368',
+                 font=self._font('Segoe UI', 8, 'italic'), bg='white', fg='#5F6368',
                  anchor='w', justify='left').pack(fill='x', pady=(6, 0))
 
     def _on_workflow_change(self):
@@ -356,38 +398,44 @@ class SetupTab:
             "Pick each item - the checklist above updates as you go",
             COLORS['primary'])
 
-        self._path_row(section, 'source', "Source folder (files to organise)",
+        # All four rows share one grid: a row used to be a Frame holding its
+        # label and a second Frame for the entry + button, eight containers
+        # that only existed to lay out the same two columns four times.
+        grid = tk.Frame(section, bg='white')
+        grid.pack(fill='x', padx=15)
+        grid.grid_columnconfigure(0, weight=1)
+
+        self._path_row(grid, 0, 'source', "Source folder (files to organise)",
                        self.app.source_folder, self.app.browse_source_folder)
-        self._path_row(section, 'itc', "ITC report template",
+        self._path_row(grid, 1, 'itc', "ITC report template",
                        self.app.itc_template, self.app.browse_itc_template)
-        self._path_row(section, 'sales', "Sales report template",
+        self._path_row(grid, 2, 'sales', "Sales report template",
                        self.app.sales_template, self.app.browse_sales_template)
-        self._path_row(section, 'target', "Target folder (where output is created)",
+        self._path_row(grid, 3, 'target', "Target folder (where output is created)",
                        self.app.target_folder, self.app.browse_target_folder)
 
-    def _path_row(self, parent, key, label, variable, command):
-        frame = tk.Frame(parent, bg='white')
-        frame.pack(fill='x', padx=15, pady=(6, 2))
-
-        tk.Label(frame, text=label, font=('Segoe UI', 9, 'bold'),
-                 bg='white', fg=COLORS['dark'], anchor='w').pack(fill='x')
+    def _path_row(self, grid, index, key, label, variable, command):
+        """Label, entry + Browse button, and problem line for one path, on
+        grid rows 3*index .. 3*index+2 of the shared `grid` frame."""
+        row = index * 3
 
-        line = tk.Frame(frame, bg='white')
-        line.pack(fill='x', pady=(3, 0))
+        tk.Label(grid, text=label, font=self._font('Segoe UI', 9, 'bold'),
+                 bg='white', fg=COLORS['dark'], anchor='w').grid(
+                     row=row, column=0, columnspan=2, sticky='ew', pady=(6, 0))
 
-        entry = tk.Entry(line, textvariable=variable, font=('Segoe UI', 9),
+        entry = tk.Entry(grid, textvariable=variable, font=self._font('Segoe UI', 9),
                          relief='solid', borderwidth=1)
-        entry.pack(side='left', fill='x', expand=True, ipady=4)
+        entry.grid(row=row + 1, column=0, sticky='ew', ipady=4, pady=(3, 0))
         self._path_tooltips[key] = Tooltip(entry, variable.get())
 
         # command= (not bind) so state='disabled' is honoured and the keyboard works
-        browse = ttk.Button(line, text="Browse…", command=command)
-        browse.pack(side='right', padx=(8, 0))
+        browse = ttk.Button(grid, text="Browse…", command=command)
+        browse.grid(row=row + 1, column=1, padx=(8, 0), pady=(3, 0))
         Tooltip(browse, BROWSE_HELP.get(key, 'Choose this item'))
 
-        problem = tk.Label(frame, text='', font=('Segoe UI', 8), bg='white',
+        problem = tk.Label(grid, text='', font=self._font('Segoe UI', 8), bg='white',
                            fg=COLORS['danger'], anchor='w')
-        problem.pack(fill='x')
+        problem.grid(row=row + 2, column=0, columnspan=2, sticky='ew', pady=(0, 2))
         self._rows[key]['problem'] = problem
 
     def _create_options(self, parent):
@@ -398,18 +446,15 @@ class SetupTab:
         holder = tk.Frame(section, bg='white')
         holder.pack(fill='x', padx=15, pady=10)
 
-        for mode_key, mode_info in PROCESSING_MODES.items():
-            block = tk.Frame(holder, bg='white')
-            block.pack(fill='x', pady=2)
-            mode_radio = tk.Radiobutton(block, text=mode_info['name'],
+        # One widget per mode: the description is the radio's second line
+        # rather than a separate Frame + Label beside it.
+        for mode_key, mode_name, mode_desc in PROCESSING_MODE_CHOICES:
+            mode_radio = tk.Radiobutton(holder, text=f"{mode_name}\n{mode_desc}",
                            variable=self.app.processing_mode, value=mode_key,
-                           font=('Segoe UI', 10, 'bold'), bg='white',
-                           fg=COLORS['dark'], anchor='w')
-            mode_radio.pack(anchor='w')
-            Tooltip(mode_radio, PROCESSING_HELP.get(mode_key, mode_info['description']))
-            tk.Label(block, text=f"     {mode_info['description']}",
-                     font=('Segoe UI', 9), bg='white', fg='#5F6368',
-                     anchor='w').pack(fill='x')
+                           font=self._font('Segoe UI', 10), bg='white',
+                           fg=COLORS['dark'], anchor='w', justify='left')
+            mode_radio.pack(anchor='w', pady=2)
+            Tooltip(mode_radio, PROCESSING_HELP.get(mode_key, mode_desc))
 
         opts = tk.Frame(holder, bg='white')
         opts.pack(fill='x', pady=(10, 0))
@@ -417,35 +462,47 @@ class SetupTab:
         self.app.client_name_check = tk.Checkbutton(
             opts, text="Include client name in Level 4 folder names",
             variable=self.app.include_client_name_in_folders,
-            font=('Segoe UI', 10), bg='white',
+            font=self._font('Segoe UI', 10), bg='white',
             command=self.app.update_global_folder_setting)
         self.app.client_name_check.pack(anchor='w')
         Tooltip(self.app.client_name_check, CLIENT_NAME_HELP)
 
         tk.Label(opts, text="Overrides the per-client setting on the next tab.",
-                 font=('Segoe UI', 8), bg='white', fg='#5F6368',
+                 font=self._font('Segoe UI', 8), bg='white', fg='#5F6368',
                  anchor='w').pack(fill='x', padx=22)
 
         length_row = tk.Frame(opts, bg='white')
         length_row.pack(fill='x', pady=(8, 0))
         tk.Label(length_row, text="Max client folder name length:",
-                 font=('Segoe UI', 9), bg='white', fg=COLORS['dark']).pack(side='left')
+                 font=self._font('Segoe UI', 9), bg='white', fg=COLORS['dark']).pack(side='left')
 
-        def on_length_change():
-            if self.app.client_name_max_length.get() <= 0:
-                self.app.client_name_max_length.set(35)
+        def on_length_change(_event=None):
+            try:
+                value = self.app.client_name_max_length.get()
+            except tk.TclError:           # left empty
+                value = LENGTH_DEFAULT
+            if value <= 0:
+                value = LENGTH_DEFAULT
+            self.app.client_name_max_length.set(
+                min(max(value, LENGTH_MIN), LENGTH_MAX))
             self._update_length_hint()
             self.app.save_cache()
 
-        spin = tk.Spinbox(length_row, from_=15, to=100, width=5,
+        # A regex match per keystroke - no int() / exception path while typing.
+        validate_key = (self.app.root.register(
+            lambda proposed: LENGTH_KEY_RE.match(proposed) is not None), '%P')
+
+        spin = tk.Spinbox(length_row, from_=LENGTH_MIN, to=LENGTH_MAX, width=5,
                           textvariable=self.app.client_name_max_length,
-                          command=on_length_change, font=('Segoe UI', 9))
+                          command=on_length_change, font=self._font('Segoe UI', 9),
+                          validate='key', validatecommand=validate_key)
         spin.pack(side='left', padx=(8, 6))
+        spin.bind('<FocusOut>', on_length_change, add='+')
         Tooltip(spin, LENGTH_HELP)
 
         # Message reflects the ACTUAL configured limit (the old text hard-coded
         # "10 chars" while the default was 35).
-        self.length_hint = tk.Label(length_row, text='', font=('Segoe UI', 8, 'italic'),
+        self.length_hint = tk.Label(length_row, text='', font=self._font('Segoe UI', 8, 'italic'),
                                     bg='white', fg='#5F6368')
         self.length_hint.pack(side='left')
         self._update_length_hint()
@@ -469,7 +526,7 @@ class SetupTab:
         # Status strip whose tint tracks readiness (set in _update_actions)
         self.action_bar = tk.Frame(card, bg='#F1F3F4')
         self.action_bar.pack(fill='x')
-        self.action_hint = tk.Label(self.action_bar, text='', font=('Segoe UI', 9, 'bold'),
+        self.action_hint = tk.Label(self.action_bar, text='', font=self._font('Segoe UI', 9, 'bold'),
                                     bg='#F1F3F4', fg='#5F6368', anchor='w',
                                     padx=16, pady=7)
         self.action_hint.pack(fill='x')
@@ -479,12 +536,12 @@ class SetupTab:
         never drift from the regexes the parser actually uses."""
         card = self._accent_card(parent, '#7B1FA2', pady=(0, 20))
 
-        tk.Label(card, text="📝  EXPECTED FILE NAMES", font=('Segoe UI', 9, 'bold'),
+        tk.Label(card, text="📝  EXPECTED FILE NAMES", font=self._font('Segoe UI', 9, 'bold'),
                  bg='white', fg='#7B1FA2', anchor='w').pack(
                      fill='x', padx=16, pady=(10, 2))
         tk.Label(card, text="Files in the source folder must follow these patterns "
                             "to be recognised.",
-                 font=('Segoe UI', 8), bg='white', fg='#5F6368',
+                 font=self._font('Segoe UI', 8), bg='white', fg='#5F6368',
                  anchor='w').pack(fill='x', padx=16, pady=(0, 6))
 
         holder = tk.Frame(card, bg='white')
@@ -495,10 +552,10 @@ class SetupTab:
             bg = '#FAF5FC' if idx % 2 == 0 else 'white'
             row = tk.Frame(holder, bg=bg)
             row.pack(fill='x')
-            tk.Label(row, text=info['type'], font=('Segoe UI', 8, 'bold'),
+            tk.Label(row, text=info['type'], font=self._font('Segoe UI', 8, 'bold'),
                      bg=bg, fg='#7B1FA2', width=16, anchor='w').pack(
                          side='left', padx=(6, 0), pady=3)
-            tk.Label(row, text=info['description'], font=('Consolas', 8),
+            tk.Label(row, text=info['description'], font=self._font('Consolas', 8),
                      bg=bg, fg=COLORS['dark'], anchor='w').pack(
                          side='left', fill='x', expand=True, pady=3)
 
@@ -2,10 +2,27 @@
 """Validation Tab - Step 2 of GST File Organizer"""
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, scrolledtext
-from utils.constants import GUI_CONFIG
+from utils.constants import GUI_CONFIG, CLIENT_TREE_COLUMNS, CLIENT_TREE_DATA_COLUMNS
+from ..utils.ui_helpers import UIHelpers
 from ..widgets.collapsible_frame import CollapsibleFrame
 
+TREE_ROW_PX = 20        # row height if the font cannot be measured
+TREE_ROW_PAD_PX = 4     # added to the font's line height for each row
+CLIENT_TREE_STYLE = 'Clients.Treeview'
+TREE_MIN_ROWS = 5
+TREE_ROW_SLACK = 2      # ignore resizes that change the fit by fewer rows
+
+SUMMARY_FONT = ('Consolas', 9)
+# set_summary drops the oldest lines beyond this, so a scan of a huge folder
+# cannot grow the Text widget without bound.
+SUMMARY_MAX_LINES = 5000
+
+INSTRUCTION_FONT = ('Arial', 10)
+INSTRUCTION_BG = '#FFF3E0'
+INSTRUCTION_FG = '#E65100'
+
 
 class ValidationTab:
     """Validation tab for client review and selection"""
@@ -13,6 +30,8 @@ class ValidationTab:
     def __init__(self, notebook, app_instance):
         self.app = app_instance
         self.notebook = notebook
+        self._tree_fit_job = None
+        self._row_px = TREE_ROW_PX
         self.create_tab()
     
     def create_tab(self):
@@ -24,14 +43,21 @@ class ValidationTab:
         main_container = tk.Frame(self.tab_frame, bg=GUI_CONFIG['colors']['light'])
         main_container.pack(fill='both', expand=True, padx=20, pady=20)
         
-        # Create two-column layout: Left (40%) for info, Right (60%) for client list
-        left_frame = tk.Frame(main_container, bg=GUI_CONFIG['colors']['light'])
-        left_frame.pack(side='left', fill='both', expand=False, padx=(0, 10))
-        left_frame.config(width=450)
+        # Two-column grid: a fixed 450px info column on the left, the client list
+        # takes all remaining width on the right.
+        main_container.grid_rowconfigure(0, weight=1)
+        main_container.grid_columnconfigure(0, weight=0, minsize=450)
+        main_container.grid_columnconfigure(1, weight=1)
+        
+        left_frame = tk.Frame(main_container, bg=GUI_CONFIG['colors']['light'],
+                              width=450)
+        left_frame.grid(row=0, column=0, sticky='ns', padx=(0, 10))
+        # Its children are packed and would otherwise widen it to their natural
+        # size (the summary box alone asks for ~80 characters).
         left_frame.pack_propagate(False)
         
         right_frame = tk.Frame(main_container, bg=GUI_CONFIG['colors']['light'])
-        right_frame.pack(side='right', fill='both', expand=True, padx=(10, 0))
+        right_frame.grid(row=0, column=1, sticky='nsew', padx=(10, 0))
         
         # Left side: Instructions and Summary
         self.create_collapsible_instructions(left_frame)
@@ -42,13 +68,14 @@ class ValidationTab:
         self.create_client_selection_section(right_frame)
     
     def create_collapsible_instructions(self, parent):
-        """Create collapsible instructions"""
-        # Create collapsible frame
-        collapse_frame = CollapsibleFrame(parent, "📋 VALIDATION INSTRUCTIONS", 
-                                        bg='#FFF3E0', relief='solid', borderwidth=2)
+        """Create collapsible instructions, built when the tab is first shown"""
+        collapse_frame = CollapsibleFrame(parent, "📋 VALIDATION INSTRUCTIONS",
+                                          content_builder=self._fill_instructions,
+                                          bg=INSTRUCTION_BG, relief='solid', borderwidth=2)
         collapse_frame.pack(fill='x', pady=(0, 15))
-        
-        # Add instructions to the sub_frame
+
+    def _fill_instructions(self, holder):
+        """Add the instruction lines to the collapsible frame's body"""
         instructions = [
             "• Review the scan summary below",
             "• Check client list - ✅ = complete, ⚠️ = missing files",
@@ -57,43 +84,60 @@ class ValidationTab:
             "• Click 'Start Processing' when ready"
         ]
         
+        # One option set for every line, with a shared named font, rather than
+        # a fresh font tuple for Tk to parse per label.
+        style = dict(font=UIHelpers.named_font(holder, INSTRUCTION_FONT),
+                     bg=INSTRUCTION_BG, fg=INSTRUCTION_FG, anchor='w')
         for instruction in instructions:
-            tk.Label(collapse_frame.sub_frame,
-                    text=instruction,
-                    font=('Arial', 10),
-                    bg='#FFF3E0',
-                    fg='#E65100',
-                    anchor='w').pack(fill='x', padx=15, pady=2)
+            tk.Label(holder, text=instruction,
+                     **style).pack(fill='x', padx=15, pady=2)
+
+        # Built after dark mode may already have been applied to the page.
+        manager = getattr(self.app, 'dark_mode_manager', None)
+        if manager is not None:
+            manager.apply_dark_mode(holder)
     
     def create_summary_section(self, parent):
         """Create scan summary section"""
-        frame = tk.Frame(parent, bg='white', relief='solid', borderwidth=2)
+        frame = UIHelpers.make_card(parent)
         frame.pack(fill='x', pady=(0, 15))
         
-        header = tk.Frame(frame, bg=GUI_CONFIG['colors']['primary'], height=40)
-        header.pack(fill='x')
-        header.pack_propagate(False)
-        
-        tk.Label(header, text="📊 SCAN SUMMARY",
-                font=('Arial', 12, 'bold'),
-                bg=GUI_CONFIG['colors']['primary'],
-                fg='white').pack(expand=True)
+        UIHelpers.create_section_header(frame, "📊 SCAN SUMMARY",
+                                        GUI_CONFIG['colors']['primary'])
         
         # Create scrollable text widget with fixed height
         text_frame = tk.Frame(frame, bg='white', height=200)
         text_frame.pack(fill='x', padx=15, pady=15)
         text_frame.pack_propagate(False)
         
+        # A read-only report: no undo stack for set_summary's inserts and
+        # deletes to be recorded into.
         self.app.summary_text = scrolledtext.ScrolledText(text_frame, 
-                                                     font=('Consolas', 9),
+                                                     font=UIHelpers.named_font(parent, SUMMARY_FONT),
                                                      bg='#f8f9fa',
                                                      state='disabled',
+                                                     undo=False,
                                                      wrap=tk.WORD)
         self.app.summary_text.pack(fill='both', expand=True)
+
+    def set_summary(self, text):
+        """Replace the scan summary in one insert.
+
+        Callers pass the whole summary as a single string ('\n'.join(lines))
+        rather than inserting line by line - each insert makes the Text widget
+        re-wrap and redisplay.
+        """
+        widget = self.app.summary_text
+        widget.config(state='normal')
+        widget.delete('1.0', 'end')
+        if text:
+            widget.insert('1.0', text)
+            widget.delete('1.0', f'end-{SUMMARY_MAX_LINES + 1}l')
+        widget.config(state='disabled')
     
     def create_validation_actions(self, parent):
         """Create validation action buttons"""
-        frame = tk.Frame(parent, bg='white', relief='solid', borderwidth=2)
+        frame = UIHelpers.make_card(parent)
         frame.pack(fill='x')
         
         tk.Label(frame,
@@ -105,55 +149,22 @@ class ValidationTab:
         button_frame = tk.Frame(frame, bg='white')
         button_frame.pack(pady=(0, 15))
         
-        # Dry run button
-        dry_btn = tk.Button(button_frame, text="🧪 DRY RUN",
-                           font=('Arial', 10, 'bold'),
-                           bg=GUI_CONFIG['colors']['warning'], 
-                           fg='white',
-                           relief='flat', 
-                           padx=15, 
-                           pady=5,
-                           cursor='hand2')
-        dry_btn.pack(side='left', padx=5)
-        dry_btn.bind('<Button-1>', lambda e: self.app.dry_run())
-
-        # Export button
-        export_btn = tk.Button(button_frame, text="📋 EXPORT LIST",
-                            font=('Arial', 10, 'bold'),
-                            bg=GUI_CONFIG['colors']['info'], 
-                            fg='white',
-                            relief='flat', 
-                            padx=15, 
-                            pady=5,
-                            cursor='hand2')
-        export_btn.pack(side='left', padx=5)
-        export_btn.bind('<Button-1>', lambda e: self.app.export_client_list())
-        
-        # Start processing button
-        start_btn = tk.Button(button_frame, text="🚀 START",
-                             font=('Arial', 10, 'bold'),
-                             bg=GUI_CONFIG['colors']['success'], 
-                             fg='white',
-                             relief='flat', 
-                             padx=15, 
-                             pady=5,
-                             cursor='hand2')
-        start_btn.pack(side='left', padx=5)
-        start_btn.bind('<Button-1>', lambda e: self.app.start_processing())
+        colors = GUI_CONFIG['colors']
+        for text, command, color in (
+            ("🧪 DRY RUN", self.app.dry_run, colors['warning']),
+            ("📋 EXPORT LIST", self.app.export_client_list, colors['info']),
+            ("🚀 START", self.app.start_processing, colors['success']),
+        ):
+            UIHelpers.make_button(button_frame, text, command, color).pack(
+                side='left', padx=5)
     
     def create_client_selection_section(self, parent):
         """Create client selection with keyboard support"""
-        frame = tk.Frame(parent, bg='white', relief='solid', borderwidth=2)
+        frame = UIHelpers.make_card(parent)
         frame.pack(fill='both', expand=True)
         
-        header = tk.Frame(frame, bg=GUI_CONFIG['colors']['success'], height=40)
-        header.pack(fill='x')
-        header.pack_propagate(False)
-        
-        tk.Label(header, text="👥 CLIENT SELECTION",
-                font=('Arial', 12, 'bold'),
-                bg=GUI_CONFIG['colors']['success'],
-                fg='white').pack(expand=True)
+        UIHelpers.create_section_header(frame, "👥 CLIENT SELECTION",
+                                        GUI_CONFIG['colors']['success'])
         
         # Selection buttons
         button_frame = tk.Frame(frame, bg='white')
@@ -178,47 +189,40 @@ class ValidationTab:
         ]
         
         for text, command, color in buttons:
-            btn = tk.Button(action_frame, text=text,
-                           font=('Arial', 10, 'bold'),
-                           bg=color, 
-                           fg='white',
-                           relief='flat', 
-                           padx=15, 
-                           pady=5,
-                           cursor='hand2')
-            btn.pack(side='left', padx=5)
-            btn.bind('<Button-1>', lambda e, cmd=command: cmd())
+            UIHelpers.make_button(action_frame, text, command, color).pack(
+                side='left', padx=5)
         
         # Client tree
         tree_frame = tk.Frame(frame, bg='white')
         tree_frame.pack(fill='both', expand=True, padx=15, pady=(0, 15))
         
+        # Every row is one line of the default font, so the row height is set
+        # once on the tree's own style. The tree then never has to work it out,
+        # and _fit_tree_height sizes by the real height rather than a guess.
+        # A derived style: everything else, dark mode's colours included, still
+        # comes from 'Treeview'.
+        try:
+            linespace = tkfont.nametofont('TkDefaultFont').metrics('linespace')
+            self._row_px = linespace + TREE_ROW_PAD_PX
+        except tk.TclError:
+            pass
+        ttk.Style(tree_frame).configure(CLIENT_TREE_STYLE, rowheight=self._row_px)
+
         # Create treeview
-        columns = ('Client', 'State', 'Status', 'Files', 'Missing', 'Extra','FolderName')
         self.app.client_tree = ttk.Treeview(tree_frame,
-                                       columns=columns,
+                                       style=CLIENT_TREE_STYLE,
+                                       columns=CLIENT_TREE_DATA_COLUMNS,
                                        show='tree headings',
-                                       height=20)
-        
-        # Configure columns
-        self.app.client_tree.column('#0', width=50)
-        self.app.client_tree.column('Client', width=250)
-        self.app.client_tree.column('State', width=100)
-        self.app.client_tree.column('Status', width=150)
-        self.app.client_tree.column('Files', width=60)
-        self.app.client_tree.column('Missing', width=180)
-        self.app.client_tree.column('Extra', width=80)
-        self.app.client_tree.column('FolderName', width=100, minwidth=80)
-        
-        # Configure headings
-        self.app.client_tree.heading('#0', text='✓')
-        self.app.client_tree.heading('Client', text='🏢 Client Name')
-        self.app.client_tree.heading('State', text='🌏 State')
-        self.app.client_tree.heading('Status', text='📊 Status')
-        self.app.client_tree.heading('Files', text='📁 Files')
-        self.app.client_tree.heading('Missing', text='❌ Missing')
-        self.app.client_tree.heading('Extra', text='➕ Extra')
-        self.app.client_tree.heading('FolderName', text='📁 Name')
+                                       height=TREE_MIN_ROWS)
+        
+        for column_id, width, minwidth, title in CLIENT_TREE_COLUMNS:
+            self.app.client_tree.column(column_id, width=width, minwidth=minwidth)
+            self.app.client_tree.heading(column_id, text=title)
+
+        # Row tints by status, set once here so populating the tree never has
+        # to restyle it (see ClientHandler.update_client_tree).
+        for tag in ('complete', 'incomplete'):
+            self.app.client_tree.tag_configure(tag, background=GUI_CONFIG['colors'][tag])
         
         # Scrollbar
         v_scroll = ttk.Scrollbar(tree_frame, orient='vertical',
@@ -236,6 +240,10 @@ class ValidationTab:
 
         tree_frame.grid_rowconfigure(0, weight=1)
         tree_frame.grid_columnconfigure(0, weight=1)
+
+        # Size the tree to the space it actually has. A fixed height=20 asked
+        # Tk for 20 rows even in a small window, laying out rows nobody sees.
+        tree_frame.bind('<Configure>', self._schedule_tree_fit)
         
         # Bind events for keyboard and mouse
         self.app.client_tree.bind('<Button-1>', self.app.on_client_click)
@@ -244,4 +252,25 @@ class ValidationTab:
         self.app.client_tree.bind('<Down>', self.app.on_down_key)
         
         # Set focus
-        self.app.client_tree.focus_set()
\ No newline at end of file
+        self.app.client_tree.focus_set()
+
+    def _schedule_tree_fit(self, event=None):
+        """Refit the tree height once per idle cycle, not once per pixel."""
+        if self._tree_fit_job is None:
+            self._tree_fit_job = self.tab_frame.after_idle(self._fit_tree_height)
+
+    def _fit_tree_height(self):
+        self._tree_fit_job = None
+        tree = getattr(self.app, 'client_tree', None)
+        if tree is None:
+            return
+        try:
+            available = tree.master.winfo_height()
+            # One row's worth is taken by the heading and scrollbar.
+            rows = max(TREE_MIN_ROWS, available // self._row_px - 1)
+            # Hysteresis: small resizes keep the current height, so a window
+            # being dragged does not relayout the tree on every step.
+            if abs(rows - int(tree.cget('height'))) > TREE_ROW_SLACK:
+                tree.configure(height=rows)
+        except tk.TclError:
+            pass                      # tab destroyed before the refit ran
@@ -1,9 +1,25 @@
 # gui/utils/__init__.py
 """GUI Utilities Package"""
 
-from .dark_mode_manager import DarkModeManager
-from .cache_manager import CacheManager
-from .ui_helpers import UIHelpers
-from .status_bar import StatusBar
+import importlib
 
-__all__ = ['DarkModeManager', 'CacheManager', 'UIHelpers', 'StatusBar']
\ No newline at end of file
+# Loaded on first access (PEP 562) rather than up front, so importing one
+# helper - CacheManager, say - does not drag in tkinter and every other module
+# here with it.
+_EXPORTS = {
+    'DarkModeManager': '.dark_mode_manager',
+    'CacheManager': '.cache_manager',
+    'UIHelpers': '.ui_helpers',
+    'StatusBar': '.status_bar',
+}
+
+__all__ = ['DarkModeManager', 'CacheManager', 'UIHelpers', 'StatusBar']
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -3,10 +3,28 @@
 
 import json
 import logging
+import os
+from collections import deque
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+RECENT_FOLDERS_MAX = 5
+
+# orjson is optional: it parses and writes the settings file faster, but the
+# stdlib json produces the same file and is always there. Both helpers work in
+# bytes so the call sites do not care which one is in use.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    def _loads(raw):
+        return json.loads(raw.decode('utf-8'))
+
+    def _dumps(data):
+        return json.dumps(data).encode('utf-8')
+
 
 class CacheManager:
     """Manages application cache and settings"""
@@ -14,39 +32,82 @@ class CacheManager:
     def __init__(self, cache_file=None):
         self.cache_file = cache_file or (Path.home() / '.gst_organizer_cache.json')
         self.cache_data = {}
+        # mtime of the file when cache_data was last read from or written to it.
+        # Lets load_cache skip re-parsing a file nobody has touched since.
+        self._mtime = None
     
     def load_cache(self):
         """Load cached settings"""
+        # No settings file yet is the normal first run, not an error - and the
+        # stat doubles as the existence check, rather than exists() then stat().
         try:
-            if self.cache_file.exists():
-                with open(self.cache_file, 'r') as f:
-                    self.cache_data = json.load(f)
-                    return self.cache_data
-        except Exception as e:
+            mtime = self.cache_file.stat().st_mtime
+        except FileNotFoundError:
+            return {}
+        except OSError as e:
             logger.error(f"Error loading cache: {e}")
-        return {}
+            return {}
+        if self.cache_data and mtime == self._mtime:
+            return self.cache_data
+        try:
+            self.cache_data = _loads(self.cache_file.read_bytes())
+        except (OSError, ValueError) as e:
+            logger.error(f"Error loading cache: {e}")
+            return {}
+        self._mtime = mtime
+        return self.cache_data
     
     def save_cache(self, data):
         """Save current settings to cache"""
         try:
-            # Preserve recent folders if they exist
-            existing_cache = self.load_cache()
-            recent_folders = existing_cache.get('recent_folders', [])
+            # Preserve recent folders if they exist. cache_data already holds
+            # what is on disk (it is refreshed after every load and save), so the
+            # file is only read when nothing has been loaded yet. The deque is a
+            # copy, so adding to it does not edit cache_data in place, and its
+            # maxlen keeps the list bounded even if the file was hand-edited.
+            existing_cache = self.cache_data or self.load_cache()
+            # Sliced first: seeding a full deque drops from the left, which
+            # here is the most recent end.
+            recent_folders = deque(
+                existing_cache.get('recent_folders', [])[:RECENT_FOLDERS_MAX],
+                maxlen=RECENT_FOLDERS_MAX)
             
             # Add current folder if not empty
             current_folder = data.get('source_folder', '')
             if current_folder and current_folder not in recent_folders:
-                recent_folders.insert(0, current_folder)
-                recent_folders = recent_folders[:5]  # Keep only last 5
+                recent_folders.appendleft(current_folder)
             
             # Update data with recent folders
-            data['recent_folders'] = recent_folders
+            data['recent_folders'] = list(recent_folders)
+            
+            # Nothing changed since the last save: skip serialising and writing.
+            # Most saves are repeats - every toggle, browse and mode change
+            # saves all settings. Compared as dicts rather than hashing the
+            # payload, which would mean serialising first. The mtime check
+            # catches the file having been replaced or removed underneath us.
+            if data == self.cache_data and self._file_mtime() == self._mtime:
+                return
             
-            with open(self.cache_file, 'w') as f:
-                json.dump(data, f)
+            # Serialised in full first, then written in one go to a temp file
+            # and renamed over the real one. A crash or a full disk mid-write
+            # used to leave a truncated file that load_cache could not parse,
+            # silently losing every setting; os.replace is atomic, so the file
+            # is always either the old settings or the new ones.
+            payload = _dumps(data)
+            tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, self.cache_file)
+            self.cache_data = data
+            self._mtime = self.cache_file.stat().st_mtime
         except Exception as e:
             logger.error(f"Error saving cache: {e}")
     
+    def _file_mtime(self):
+        try:
+            return self.cache_file.stat().st_mtime
+        except OSError:
+            return None
+    
     def get_cached_value(self, key, default=None):
         """Get a cached value"""
         return self.cache_data.get(key, default)
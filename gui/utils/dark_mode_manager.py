@@ -21,6 +21,8 @@ from utils.constants import GUI_CONFIG
 
 logger = logging.getLogger(__name__)
 
+COLORS = GUI_CONFIG['colors']
+
 # Colour options worth theming, if the widget supports them.
 THEMED_OPTIONS = (
     'background', 'foreground', 'insertbackground', 'selectcolor',
@@ -49,12 +51,21 @@ TTK_STYLES = {
 }
 
 
+# Configures many widgets in one call; see DarkModeManager._configure_all.
+# `items` is a flat list: widget path, then that widget's option/value list.
+CONFIGURE_ALL_PROC = (
+    'proc ::gst_configure_all {items} {'
+    ' foreach {w opts} $items { catch {$w configure {*}$opts} } }'
+)
+
+
 class DarkModeManager:
     """Toggle dark mode, restoring the exact colours that were there before."""
 
     def __init__(self, root, style):
         self.root = root
         self.style = style
+        root.tk.eval(CONFIGURE_ALL_PROC)
         self.is_initialized = False
         self.is_dark_mode = False
 
@@ -67,6 +78,10 @@ class DarkModeManager:
         # same path. Weak keys so destroyed widgets do not accumulate.
         self._original = weakref.WeakKeyDictionary()
         self._original_ttk = {}
+        # winfo_class() -> themed options that class accepts; see _supported.
+        self._supported_by_class = {}
+        self._dark_ttk = None           # see _apply_ttk_dark
+        self._dark_by_class = {}        # winfo_class() -> dark colours; see _to_dark
         self._original_root_bg = None
 
         self.dark_colors = {
@@ -102,27 +117,60 @@ class DarkModeManager:
             self._original_ttk[style_name] = saved
 
     # ------------------------------------------------------------- public API
-    def apply_dark_mode(self):
+    def apply_dark_mode(self, widget=None):
+        """Switch to dark, or with `widget`, theme just that subtree.
+
+        Widgets built while dark (the Validation tab's instructions, built when
+        the tab is first opened) only need their own subtree themed; walking
+        the whole app for them costs a Tcl round trip per widget in every tab.
+        A subtree call while light does nothing - the ttk styles are app-wide,
+        so it could only half-darken.
+        """
+        if widget is not None:
+            if self.is_dark_mode:
+                widgets = self._collect(widget)
+                self._each(widgets, self._capture_widget)
+                self._configure_all(self._dark_values_for(widgets))
+            return
+
         self.is_dark_mode = True
 
         # TWO PASSES, and the order matters. Capture the whole tree BEFORE
         # anything is mutated: doing it in one pass meant the root window (and
         # anything else re-coloured on the way in) was recorded with its dark
-        # value and could never be restored.
-        self._walk(self.root, self._capture_widget)
+        # value and could never be restored. The tree is listed once and both
+        # passes run over that list, rather than asking Tk for every widget's
+        # children twice.
+        widgets = self._collect(self.root)
+        self._each(widgets, self._capture_widget)
 
         self._apply_ttk_dark()
-        self._walk(self.root, self._to_dark)
+        self._configure_all(self._dark_values_for(widgets))
 
     def restore_original_colors(self):
+        # Already light: nothing to undo. Replaying here would also be wrong,
+        # not just wasted - the captured colours date from the last switch to
+        # dark, and anything recoloured since (checklist tints, rebuilt rows)
+        # would be put back to those stale values.
+        #
+        # apply_dark_mode deliberately has no such guard: calling it again while
+        # dark is how widgets created after the toggle get themed.
+        if not self.is_dark_mode:
+            return
         self.is_dark_mode = False
         self._restore_ttk()
-        self._walk(self.root, self._to_original)
+        # Only captured widgets have anything to put back, and _original already
+        # lists exactly those - no need to walk the tree to find them again.
+        # Replay exactly what was captured. No guessing, no defaults.
+        self._configure_all([(widget, saved)
+                             for widget, saved in list(self._original.items())
+                             if saved])
 
     # ------------------------------------------------------------------- ttk
-    def _apply_ttk_dark(self):
+    def _dark_ttk_table(self):
+        """The ttk style options for dark mode, built from dark_colors."""
         d = self.dark_colors
-        dark = {
+        return {
             'TFrame': {'background': d['bg']},
             'TLabel': {'background': d['bg'], 'foreground': d['fg']},
             'TNotebook': {'background': d['bg']},
@@ -131,13 +179,20 @@ class DarkModeManager:
             'TEntry': {'fieldbackground': d['widget_bg'], 'foreground': d['fg']},
             'TCombobox': {'fieldbackground': d['widget_bg'], 'foreground': d['fg']},
             'TScrollbar': {'background': d['button_bg'], 'troughcolor': d['trough']},
-            'TProgressbar': {'background': GUI_CONFIG['colors']['primary'],
+            'TProgressbar': {'background': COLORS['primary'],
                              'troughcolor': d['trough']},
             'Treeview': {'background': d['widget_bg'], 'foreground': d['fg'],
                          'fieldbackground': d['widget_bg']},
             'Treeview.Heading': {'background': d['button_bg'], 'foreground': d['fg']},
         }
-        for style_name, options in dark.items():
+
+    def _apply_ttk_dark(self):
+        d = self.dark_colors
+        # Built on first use and then reused - it only depends on dark_colors,
+        # so rebuilding eleven dicts on every toggle bought nothing.
+        if self._dark_ttk is None:
+            self._dark_ttk = self._dark_ttk_table()
+        for style_name, options in self._dark_ttk.items():
             try:
                 self.style.configure(style_name, **options)
             except Exception as e:
@@ -167,34 +222,52 @@ class DarkModeManager:
                            foreground=[('selected', 'black')])
             self.style.map('Treeview',
                            foreground=[('selected', 'black')],
-                           background=[('selected', GUI_CONFIG['colors']['primary'])])
+                           background=[('selected', COLORS['primary'])])
         except Exception:
             pass
 
     # --------------------------------------------------------------- widgets
-    def _walk(self, widget, action):
-        """Depth-first over the whole widget tree, skipping nothing silently."""
-        try:
-            action(widget)
-        except tk.TclError:
-            pass                      # widget went away mid-walk
-        except Exception as e:
-            logger.debug(f"Theming {widget} failed: {e}")
+    def _collect(self, widget):
+        """Every widget under (and including) `widget`, depth-first."""
+        found = []
+        stack = [widget]
+        while stack:
+            current = stack.pop()
+            found.append(current)
+            try:
+                children = current.winfo_children()
+            except Exception:
+                continue              # widget went away mid-walk
+            stack.extend(reversed(children))
+        return found
 
-        try:
-            children = widget.winfo_children()
-        except Exception:
-            return
-        for child in children:
-            self._walk(child, action)
+    def _each(self, widgets, action):
+        """Apply `action` to every widget, skipping nothing silently."""
+        for widget in widgets:
+            try:
+                action(widget)
+            except tk.TclError:
+                pass                  # widget went away mid-walk
+            except Exception as e:
+                logger.debug(f"Theming {widget} failed: {e}")
 
-    def _supported(self, widget):
-        """The themed options this particular widget actually accepts."""
-        try:
-            keys = set(widget.keys())
-        except Exception:
-            return ()
-        return tuple(o for o in THEMED_OPTIONS if o in keys)
+    def _supported(self, widget, cls=None):
+        """The themed options this particular widget actually accepts.
+
+        Cached per widget class: every Label accepts the same options, and
+        keys() is a Tcl round trip returning the widget's full option list.
+        """
+        if cls is None:
+            cls = widget.winfo_class()
+        options = self._supported_by_class.get(cls)
+        if options is None:
+            try:
+                keys = set(widget.keys())
+            except Exception:
+                return ()
+            options = tuple(o for o in THEMED_OPTIONS if o in keys)
+            self._supported_by_class[cls] = options
+        return options
 
     def _capture(self, widget, options):
         """Save the widget's current colours once, before anything changes them."""
@@ -221,51 +294,79 @@ class DarkModeManager:
             self._capture(widget, options)
 
     def _to_dark(self, widget):
-        options = self._supported(widget)
+        """The dark colours for `widget`, or None if it has nothing to theme."""
+        cls = widget.winfo_class()
+        options = self._supported(widget, cls)
         if not options:
-            return
+            return None
         # Belt and braces: the capture pass has already run, but a widget created
         # after the first toggle would otherwise be mutated before being saved.
         self._capture(widget, options)
 
-        cls = widget.winfo_class()
+        # One lookup per widget: the dark colours depend only on the class, so
+        # they are worked out the first time a class is seen and shared after.
+        values = self._dark_by_class.get(cls)
+        if values is None:
+            values = self._dark_by_class[cls] = self._dark_config(cls, options)
+        return values
+
+    def _dark_config(self, cls, options):
+        """The dark colours for a widget class accepting `options`."""
         d = self.dark_colors
         surface = d['widget_bg'] if cls in FIELD_CLASSES else (
             d['button_bg'] if cls in BUTTON_CLASSES else d['bg'])
+        dark = {
+            'background': surface,
+            'foreground': d['fg'],
+            'insertbackground': d['fg'],
+            'selectcolor': d['widget_bg'],
+            'activebackground': d['widget_bg'],
+            'activeforeground': d['fg'],
+            'troughcolor': d['trough'],
+        }
+        return {option: dark[option] for option in options if option in dark}
 
-        values = {}
-        if 'background' in options:
-            values['background'] = surface
-        if 'foreground' in options:
-            values['foreground'] = d['fg']
-        if 'insertbackground' in options:
-            values['insertbackground'] = d['fg']
-        if 'selectcolor' in options:
-            values['selectcolor'] = d['widget_bg']
-        if 'activebackground' in options:
-            values['activebackground'] = d['widget_bg']
-        if 'activeforeground' in options:
-            values['activeforeground'] = d['fg']
-        if 'troughcolor' in options:
-            values['troughcolor'] = d['trough']
-
-        if values:
-            widget.configure(**values)
-
-    def _to_original(self, widget):
-        """Replay exactly what was captured. No guessing, no defaults."""
-        try:
-            saved = self._original.get(widget)
-        except TypeError:
-            saved = None
-        if not saved:
+    def _dark_values_for(self, widgets):
+        """(widget, dark colours) for every widget that has something to theme."""
+        pending = []
+        for widget in widgets:
+            try:
+                values = self._to_dark(widget)
+            except tk.TclError:
+                continue              # widget went away mid-walk
+            except Exception as e:
+                logger.debug(f"Theming {widget} failed: {e}")
+                continue
+            if values:
+                pending.append((widget, values))
+        return pending
+
+    def _configure_all(self, pending):
+        """Configure every (widget, colours) pair in ONE Tcl call.
+
+        widget.configure() is a Python -> Tcl round trip each, and a toggle
+        touches every widget in the app. The Tk option database cannot replace
+        this - it only supplies defaults to widgets created later, and nearly
+        every widget here sets its colours explicitly - so the configures are
+        handed to CONFIGURE_ALL_PROC together. Each one is wrapped in `catch`,
+        so a widget destroyed since it was collected cannot stop the rest.
+
+        The values travel as a nested tuple, which tkinter passes as Tcl lists
+        without any quoting. They were spliced into a script string before, and
+        a value with an unbalanced brace or trailing backslash broke the parse
+        of the WHOLE script, leaving every widget un-themed.
+        """
+        items = []
+        for widget, values in pending:
+            items.append(widget._w)
+            items.append(tuple(part for option, value in values.items()
+                               for part in (f'-{option}', value)))
+        if not items:
             return
         try:
-            widget.configure(**saved)
-        except tk.TclError:
-            pass
-        except Exception as e:
-            logger.debug(f"Restoring {widget} failed: {e}")
+            self.root.tk.call('::gst_configure_all', tuple(items))
+        except tk.TclError as e:
+            logger.debug(f"Theming failed: {e}")
 
     # ------------------------------------------------------------------ trees
     def update_tree_tags(self, tree_widget, is_dark_mode=None):
@@ -287,8 +388,8 @@ class DarkModeManager:
                                       foreground=self.dark_colors['fg'])
         else:
             tree_widget.tag_configure('complete',
-                                      background=GUI_CONFIG['colors']['complete'],
+                                      background=COLORS['complete'],
                                       foreground='black')
             tree_widget.tag_configure('incomplete',
-                                      background=GUI_CONFIG['colors']['incomplete'],
+                                      background=COLORS['incomplete'],
                                       foreground='black')
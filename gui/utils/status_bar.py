@@ -4,34 +4,42 @@
 import tkinter as tk
 from utils.constants import GUI_CONFIG
 
+COLORS = GUI_CONFIG['colors']
+
 
 class StatusBar:
     """Status bar for the application"""
     
     def __init__(self, parent):
         self.parent = parent
+        self._last_message = None
         self.create_status_bar()
     
     def create_status_bar(self):
         """Create status bar"""
-        status_frame = tk.Frame(self.parent, bg=GUI_CONFIG['colors']['dark'], height=30)
+        status_frame = tk.Frame(self.parent, bg=COLORS['dark'], height=30)
         status_frame.pack(fill='x', side='bottom')
         status_frame.pack_propagate(False)
         
         self.status_label = tk.Label(status_frame,
                                    text="💡 Ready to organize your GST files!",
                                    font=('Arial', 9),
-                                   bg=GUI_CONFIG['colors']['dark'],
+                                   bg=COLORS['dark'],
                                    fg='white')
         self.status_label.pack(side='left', padx=10, pady=6)
         
         version_label = tk.Label(status_frame,
                                text="v3.0 | Production Ready",
                                font=('Arial', 9),
-                               bg=GUI_CONFIG['colors']['dark'],
+                               bg=COLORS['dark'],
                                fg='#BDBDBD')
         version_label.pack(side='right', padx=10, pady=6)
     
     def update_status(self, message):
         """Update status message"""
-        self.status_label.config(text=f"💡 {message}")
\ No newline at end of file
+        # Workers report the same status repeatedly; re-setting identical text
+        # still costs a Tcl call and a redraw.
+        if message == self._last_message:
+            return
+        self._last_message = message
+        self.status_label.config(text=f"💡 {message}")
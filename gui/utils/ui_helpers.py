@@ -1,8 +1,88 @@
 # gui/utils/ui_helpers.py
 """UI Helper Functions"""
 
+import collections
+import threading
+import time
+import weakref
 import tkinter as tk
-from datetime import datetime
+import tkinter.font as tkfont
+
+# Section styling is drawn from a small fixed set, so build it once rather than
+# per call.
+SECTION_TITLE_FONT = ('Arial', 12, 'bold')
+SECTION_BODY_FONT = ('Arial', 10)
+SECTION_BODY_FG = '#323130'
+SECTION_BG = 'white'
+
+
+def _named_font(widget, spec):
+    """The named Tk font for a font tuple, one per root window.
+
+    A font tuple is re-parsed by Tk for every widget it is passed to; a named
+    font is resolved once and shared. The fonts are held on the root itself,
+    so they go away with it instead of keeping every interpreter ever created
+    (one per GUI test, say) alive in a module-level cache.
+    """
+    root = widget._root()
+    fonts = getattr(root, '_named_fonts', None)
+    if fonts is None:
+        fonts = root._named_fonts = {}
+    font = fonts.get(spec)
+    if font is None:
+        font = fonts[spec] = tkfont.Font(root=root, font=spec)
+    return font
+
+
+def _button_font(widget, size):
+    return _named_font(widget, ('Arial', size, 'bold'))
+
+
+# Log lines waiting to be written, per log widget. A processing run logs in
+# bursts, and writing each line on its own meant a state toggle, an insert and a
+# see('end') redraw per line - hundreds a second. Lines now queue here and are
+# written together at most every LOG_FLUSH_MS. log_message is also called from
+# the worker thread, hence the lock.
+LOG_FLUSH_MS = 50
+_pending_logs = {}
+_pending_lock = threading.Lock()
+
+# Oldest lines are dropped beyond this many, so a long run cannot grow the log
+# widget - and the cost of every insert and scroll into it - without bound.
+LOG_MAX_LINES = 5000
+
+# (second, 'HH:MM:SS') of the last log timestamp. Log lines arrive in bursts
+# within the same second, and strftime is the slow part of formatting one. One
+# tuple swap keeps it consistent across the worker and UI threads.
+_timestamp_cache = (None, '')
+
+
+def _timestamp():
+    global _timestamp_cache
+    second = int(time.time())
+    if second != _timestamp_cache[0]:
+        _timestamp_cache = (second, time.strftime('%H:%M:%S', time.localtime(second)))
+    return _timestamp_cache[1]
+
+
+def _insert_args(lines):
+    """Flatten (text, tag) lines into one Text.insert argument list.
+
+    Text.insert takes any number of text/tag pairs, so a whole batch goes in
+    with one call instead of one Tcl round trip - and one re-layout - per line.
+    Consecutive lines with the same tag are joined into a single pair.
+    """
+    args = []
+    for text, tag in lines:
+        if args and args[-1] == tag:
+            args[-2] += text
+        else:
+            args += [text, tag]
+    return args
+
+
+# progress label -> (value, message) it last showed; see update_progress.
+_last_progress = weakref.WeakKeyDictionary()
 
 
 class UIHelpers:
@@ -16,48 +96,112 @@ class UIHelpers:
     @staticmethod
     def log_message(log_widget, message, level='normal'):
         """Add timestamped message to log widget"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        formatted_message = f"[{timestamp}] {message}\n"
+        formatted_message = f"[{_timestamp()}] {message}\n"
         
-        # Schedule the update
-        log_widget.after(0, lambda: UIHelpers._add_log_message(
-            log_widget, formatted_message, level
-        ))
+        with _pending_lock:
+            queue = _pending_logs.get(log_widget)
+            first = queue is None
+            if first:
+                queue = _pending_logs[log_widget] = collections.deque()
+            # 'normal' lines carry no tag: they are drawn in the widget's own
+            # foreground, and untagged text leaves the Text no tag ranges to
+            # track - most of a run's log is 'normal'.
+            queue.append((formatted_message, '' if level == 'normal' else level))
+
+        # Only the first line of a batch schedules a flush; the rest ride along.
+        if first:
+            log_widget.after(LOG_FLUSH_MS,
+                             lambda: UIHelpers._flush_log(log_widget))
     
     @staticmethod
-    def _add_log_message(log_widget, message, level):
-        """Actually add the message to log widget"""
+    def _flush_log(log_widget):
+        """Write every queued line to the log widget in one go"""
+        with _pending_lock:
+            queue = _pending_logs.pop(log_widget, None)
+        if not queue:
+            return
+        # Follow the end only if the view is already there. see('end') on every
+        # flush re-laid out and redrew the view even while the user had
+        # scrolled back to read an earlier line - and yanked them away from it.
+        follow = log_widget.yview()[1] >= 1.0
         log_widget.config(state='normal')
-        log_widget.insert('end', message, level)
-        log_widget.see('end')
+        log_widget.insert('end', *_insert_args(queue))
+        log_widget.delete('1.0', f'end-{LOG_MAX_LINES + 1}l')
+        if follow:
+            log_widget.see('end')
         log_widget.config(state='disabled')
     
     @staticmethod
     def update_progress(progress_var, progress_label, current_op_label, value, message):
         """Update progress display"""
-        progress_var.set(value)
-        progress_label.config(text=f"📊 Progress: {value:.1f}%")
-        current_op_label.config(text=message)
+        # Skip repeats: the worker reports per file, often without the value or
+        # message having moved, and each set redraws its widget. The value is
+        # compared at the 0.1% the label shows - the bar cannot show finer - so
+        # sub-step reports do not redraw the bar and label, and an unchanged
+        # message does not redraw the operation line.
+        value = round(value, 1)
+        last_value, last_message = _last_progress.get(progress_label, (None, None))
+        _last_progress[progress_label] = (value, message)
+        if value != last_value:
+            progress_var.set(value)
+            progress_label.config(text=f"📊 Progress: {value:.1f}%")
+        if message != last_message:
+            current_op_label.config(text=message)
     
     @staticmethod
-    def create_colored_section(parent, title, description, color):
-        """Create a colored section frame"""
-        section_frame = tk.Frame(parent, bg='white', relief='solid', borderwidth=2)
-        section_frame.pack(fill='x', pady=10)
-        
-        # Header
-        header_frame = tk.Frame(section_frame, bg=color, height=40)
+    def named_font(widget, spec):
+        """The shared named font for a font tuple such as ('Segoe UI', 9, 'bold').
+
+        Pass this instead of the tuple where many widgets use the same font:
+        Tk parses a tuple again for every widget it is given, but resolves a
+        named font once for all of them.
+        """
+        return _named_font(widget, spec)
+
+    @staticmethod
+    def make_button(parent, text, command, color, size=10, pad=(15, 5), **options):
+        """Create a flat, coloured action button.
+
+        Wired with command= rather than bind('<Button-1>') so a disabled button
+        really is disabled and the button works from the keyboard.
+        """
+        return tk.Button(parent, text=text, command=command,
+                         font=_button_font(parent, size),
+                         bg=color, fg='white', relief='flat',
+                         padx=pad[0], pady=pad[1], cursor='hand2', **options)
+
+    @staticmethod
+    def make_card(parent):
+        """Create the white, solid-bordered frame every titled card sits in.
+
+        Returned unpacked; the caller places it.
+        """
+        return tk.Frame(parent, bg=SECTION_BG, relief='solid', borderwidth=2)
+
+    @staticmethod
+    def create_section_header(parent, title, color):
+        """Create the coloured 40px title band used at the top of every card"""
+        header_frame = tk.Frame(parent, bg=color, height=40)
         header_frame.pack(fill='x')
         header_frame.pack_propagate(False)
         
         tk.Label(header_frame, text=title,
-                font=('Arial', 12, 'bold'),
+                font=_named_font(parent, SECTION_TITLE_FONT),
                 bg=color, fg='white').pack(expand=True)
+        return header_frame
+    
+    @staticmethod
+    def create_colored_section(parent, title, description, color):
+        """Create a colored section frame"""
+        section_frame = UIHelpers.make_card(parent)
+        section_frame.pack(fill='x', pady=10)
+        
+        UIHelpers.create_section_header(section_frame, title, color)
         
         # Description
         tk.Label(section_frame, text=description,
-                font=('Arial', 10),
-                bg='white', fg='#323130',
+                font=_named_font(parent, SECTION_BODY_FONT),
+                bg=SECTION_BG, fg=SECTION_BODY_FG,
                 wraplength=500).pack(pady=10)
         
         return section_frame
\ No newline at end of file
@@ -3,39 +3,69 @@
 
 import tkinter as tk
 
+from ..utils.ui_helpers import UIHelpers
+
+TOGGLE_FONT = ('Arial', 10)
+TITLE_FONT = ('Arial', 11, 'bold')
+# Toggle button text while the body is shown / hidden. Only the arrow changes;
+# the title is a separate label that a toggle never touches.
+EXPANDED_ARROW = "▼"
+COLLAPSED_ARROW = "▶"
+
 
 class CollapsibleFrame(tk.Frame):
     """A collapsible frame widget"""
-    def __init__(self, parent, title="", **kwargs):
+    def __init__(self, parent, title="", content_builder=None, collapsed=False,
+                 **kwargs):
+        """content_builder, if given, is called with sub_frame to fill it the
+        first time sub_frame is shown - when it is first mapped, or first
+        expanded if collapsed=True starts the frame closed - so content on a
+        page nobody opens is never built."""
         tk.Frame.__init__(self, parent, **kwargs)
         
+        self._content_builder = content_builder
         self.show = tk.IntVar()
-        self.show.set(1)
+        self.show.set(0 if collapsed else 1)
         
         self.title_frame = tk.Frame(self)
         self.title_frame.pack(fill="x", expand=1)
         
         self.toggle_button = tk.Button(self.title_frame, 
-                                     text="▼", 
+                                     text=COLLAPSED_ARROW if collapsed else EXPANDED_ARROW, 
                                      width=2,
                                      command=self.toggle,
                                      relief="flat",
-                                     font=('Arial', 10))
+                                     font=UIHelpers.named_font(self, TOGGLE_FONT))
         self.toggle_button.pack(side="left")
         
         tk.Label(self.title_frame, text=title, 
-                font=('Arial', 11, 'bold')).pack(side="left", padx=5)
+                font=UIHelpers.named_font(self, TITLE_FONT)).pack(side="left", padx=5)
         
         self.sub_frame = tk.Frame(self, relief="sunken", borderwidth=1)
-        self.sub_frame.pack(fill="both", expand=1, padx=10, pady=5)
-        
+        if not collapsed:
+            # pack maps a child only once its parent is mapped, so this waits
+            # until the page holding the frame is actually displayed.
+            self.sub_frame.bind('<Map>', self._on_first_map)
+            self.sub_frame.pack(fill="both", expand=1, padx=10, pady=5)
+
+    def _on_first_map(self, _event):
+        self.sub_frame.unbind('<Map>')
+        self._build_content()
+
+    def _build_content(self):
+        """Run the content builder, once."""
+        builder, self._content_builder = self._content_builder, None
+        if builder is not None:
+            builder(self.sub_frame)
+
     def toggle(self):
         """Toggle the collapsible frame"""
         if self.show.get():
             self.sub_frame.pack_forget()
-            self.toggle_button.config(text="▶")
+            self.toggle_button.config(text=COLLAPSED_ARROW)
             self.show.set(0)
         else:
+            self._build_content()
             self.sub_frame.pack(fill="both", expand=1, padx=10, pady=5)
-            self.toggle_button.config(text="▼")
+            self.toggle_button.config(text=EXPANDED_ARROW)
             self.show.set(1)
\ No newline at end of file
@@ -3,43 +3,159 @@ Power Query Extractor GUI Window - Two Tab Design
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox, filedialog
 import os
 import logging
 import threading
+import time
 import json
+from collections import deque
 from pathlib import Path
 from datetime import datetime
+from typing import NamedTuple
 from ..core.report_processor import ReportProcessor
 from ..core.data_consolidator import DataConsolidator
 from ..core.refresh_naming import is_refreshed_name
 
 logger = logging.getLogger(__name__)
 
-
-def _classify_version_reports(version_folder):
-    """Return (has_itc, has_sales) for a version folder using a SINGLE
-    directory listing instead of two separate glob() passes.
-
-    Reproduces the old checks exactly:
-        glob("ITC_Report_*.xlsx")  -> has_itc
-        glob("Sales_Report_*.xlsx") -> has_sales
-    On Windows glob is case-insensitive and '*' matches the '_Refreshed_'
-    variants too, so we lower-case the name and match the same way.
+# Every titled section (Target Folder, Processing Options, ...) is a LabelFrame
+# with the same look; defined once here rather than repeated at each one.
+SECTION_FRAME_OPTIONS = {
+    'font': ('Segoe UI', 11, 'bold'),
+    'bg': 'white',
+    'padx': 15,
+    'pady': 15,
+}
+
+# Client list row styling. Every row uses the same two fonts, so they are built
+# once per panel as named Tk fonts (see ExtractorPanel._init_fonts): a font
+# tuple is re-parsed by Tk for each widget it is passed to.
+ROW_FONT = ('Segoe UI', 10)
+STATUS_FONT = ('Segoe UI', 9)
+STATUS_FG = '#666'
+# The Browse and client-selection buttons; a named font too, for the same reason.
+BUTTON_FONT = ('Segoe UI', 9)
+
+# Oldest log lines are dropped beyond this, so a long run cannot grow the Text
+# widget (and the cost of every insert and scroll into it) without bound.
+LOG_MAX_LINES = 5000
+
+# Read and set many Tcl variables in one call; see ExtractorPanel._set_checks.
+# Names and values are passed as list arguments, never spliced into a script.
+GET_VARS_PROC = (
+    'proc ::pqe_get_vars {names} {'
+    ' set values {}; foreach name $names { lappend values [set ::$name] };'
+    ' return $values }'
+)
+SET_VARS_PROC = (
+    'proc ::pqe_set_vars {items} {'
+    ' foreach {name value} $items { set ::$name $value } }'
+)
+
+# (second, '[HH:MM:SS] ') prefix of the last log line. A run logs several lines
+# per client, mostly within the same second, and formatting the clock is the
+# costly part of building a line. Swapped as one tuple, so the worker and UI
+# threads always see a matching pair.
+_log_prefix = (None, '')
+
+
+def _timestamp_prefix():
+    """'[HH:MM:SS] ' for now, formatted at most once per second."""
+    global _log_prefix
+    second = int(time.time())
+    if second != _log_prefix[0]:
+        _log_prefix = (second, time.strftime('[%H:%M:%S] ', time.localtime(second)))
+    return _log_prefix[1]
+
+
+class ClientScan(NamedTuple):
+    """One client found by scan_folder.
+
+    A tuple rather than a dict: there can be hundreds per scan and they are
+    only ever read. start_processing turns the selected ones into dicts for
+    the processor, which adds its own per-run keys.
+    """
+    name: str
+    path: Path
+    latest_version: Path
+    has_itc: bool
+    has_sales: bool
+    # (itc_status, sales_status): formatted times of the newest refreshed
+    # reports, read with the same listing that found them.
+    refresh_status: tuple
+
+
+# Log text colour per level, configured once as Text tags. 'info' - most of the
+# log - is not here: those lines are inserted untagged, in the widget's own
+# foreground, so the Text has no tag ranges to track for them.
+LOG_LEVEL_COLORS = {
+    'success': '#28a745',
+    'warning': '#ffc107',
+    'error': '#dc3545',
+}
+
+
+def _scan_version_folder(version_folder, suffix_pattern=None):
+    """Return (has_itc, has_sales, itc_status, sales_status) for a version
+    folder from ONE directory listing.
+
+    The scan needs both which reports exist and when they were last
+    refreshed. Those used to be two listings per client - on a network share,
+    the slow part of a scan - so both are read from the same pass here.
+
+    Report presence matches the old glob("ITC_Report_*.xlsx") and
+    glob("Sales_Report_*.xlsx") checks: on Windows glob is case-insensitive
+    and '*' matches the '_Refreshed_' copies too, hence the lower-cased
+    prefix test.
     """
     has_itc = False
     has_sales = False
+    itc_mtime = None
+    sales_mtime = None
     try:
         with os.scandir(version_folder) as entries:
             for entry in entries:
                 nl = entry.name.lower()
-                if nl.startswith('itc_report_') and nl.endswith('.xlsx'):
-                    has_itc = True
-                elif nl.startswith('sales_report_') and nl.endswith('.xlsx'):
-                    has_sales = True
+                is_itc = nl.startswith('itc_report_')
+                is_sales = not is_itc and nl.startswith('sales_report_')
+                if not (is_itc or is_sales):
+                    continue
+                if nl.endswith('.xlsx'):
+                    if is_itc:
+                        has_itc = True
+                    else:
+                        has_sales = True
+                if not is_refreshed_name(entry.name, suffix_pattern):
+                    continue
+                m = entry.stat().st_mtime
+                if is_itc:
+                    if itc_mtime is None or m > itc_mtime:
+                        itc_mtime = m
+                elif sales_mtime is None or m > sales_mtime:
+                    sales_mtime = m
     except OSError:
         pass
-    return has_itc, has_sales
+    return has_itc, has_sales, _format_mtime(itc_mtime), _format_mtime(sales_mtime)
+
+
+def _subfolders(folder):
+    """The sub-directories of `folder` as os.DirEntry objects.
+
+    The scan used Path.iterdir() + is_dir() and glob() + stat(), building a
+    Path and making a stat call per entry. A DirEntry gets is_dir() from the
+    listing itself, and on Windows its stat() too, which matters on the
+    network shares these folders usually live on.
+    """
+    with os.scandir(folder) as entries:
+        return [entry for entry in entries if entry.is_dir()]
+
+
+def _format_mtime(mtime):
+    if mtime is None:
+        return None
+    return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
 
 
 def _latest_refresh_times(version_folder, suffix_pattern=None):
@@ -55,31 +171,53 @@ def _latest_refresh_times(version_folder, suffix_pattern=None):
     a customised suffix is recognised; previously this hardcoded "_Refreshed_",
     so changing the setting made every report read as "Never refreshed".
     """
-    itc_mtime = None
-    sales_mtime = None
-    try:
-        with os.scandir(version_folder) as entries:
-            for entry in entries:
-                nl = entry.name.lower()
-                if not is_refreshed_name(entry.name, suffix_pattern):
-                    continue
-                if nl.startswith('itc_report_'):
-                    m = entry.stat().st_mtime
-                    if itc_mtime is None or m > itc_mtime:
-                        itc_mtime = m
-                elif nl.startswith('sales_report_'):
-                    m = entry.stat().st_mtime
-                    if sales_mtime is None or m > sales_mtime:
-                        sales_mtime = m
-    except OSError:
-        pass
+    return _scan_version_folder(version_folder, suffix_pattern)[2:]
 
-    def _fmt(mt):
-        if mt is None:
-            return None
-        return datetime.fromtimestamp(mt).strftime("%Y-%m-%d %H:%M")
 
-    return _fmt(itc_mtime), _fmt(sales_mtime)
+def _find_clients(base_path, suffix_pattern=None):
+    """Return (level1_folder, clients) for a target folder, or (None, []) if it
+    holds no "Annual Statement-*" folder.
+
+    Touches only the disk, never Tk, so ExtractorPanel.scan_folder can run it
+    on a worker thread.
+    """
+    annual_folders = list(base_path.glob("Annual Statement-*"))
+    if not annual_folders:
+        return None, []
+
+    # Use latest Annual Statement folder
+    latest_folder = max(annual_folders, key=lambda x: x.stat().st_mtime)
+
+    clients = []
+    for client_folder in _subfolders(latest_folder):
+        if client_folder.name.startswith('_'):
+            continue
+        # Check for version folders
+        version_folders = [v for v in _subfolders(client_folder.path)
+                           if v.name.lower().startswith('version-')]
+        if not version_folders:
+            continue
+        # Pick the newest version by modified-time (same as the level-1 folder
+        # above). Sorting by name is wrong because the name is
+        # "Version-DDMMYY HHMM" - day-first text does not sort chronologically
+        # across month boundaries (e.g. "300626" would sort after "020726").
+        latest_version = Path(max(version_folders,
+                                  key=lambda x: x.stat().st_mtime).path)
+
+        # Which reports exist and when they were last refreshed, from a single
+        # directory listing
+        has_itc, has_sales, itc_status, sales_status = \
+            _scan_version_folder(latest_version, suffix_pattern)
+
+        clients.append(ClientScan(
+            name=client_folder.name,
+            path=Path(client_folder.path),
+            latest_version=latest_version,
+            has_itc=has_itc,
+            has_sales=has_sales,
+            refresh_status=(itc_status, sales_status),
+        ))
+    return latest_folder, clients
 
 
 def configure_extractor_styles():
@@ -117,11 +255,25 @@ class ExtractorPanel(ttk.Frame):
         # the extractor can auto-load the folder the main app last used.
         self.cache_file = Path.home() / '.gst_organizer_cache.json'
         self.is_processing = False
+        self._scrollregion_job = None
+        # Bumped by every scan_folder call; see there.
+        self._scan_generation = 0
+        # Log lines and progress waiting for the UI thread; see log_message and
+        # update_progress. One lock guards both.
+        self._pending_log = deque()
+        self._log_lock = threading.Lock()
+        # Latest progress not yet drawn, and the last one that was; see
+        # update_progress.
+        self._pending_progress = None
+        self._shown_progress = None
         # When embedded, the host already provides a title banner and status bar.
         self.show_header = show_header
         self.show_status_bar = show_status_bar
+        self.tk.eval(GET_VARS_PROC)
+        self.tk.eval(SET_VARS_PROC)
 
         self._init_vars()
+        self._init_fonts()
         self.create_widgets()
 
         # Auto-load folder if available.
@@ -144,6 +296,12 @@ class ExtractorPanel(ttk.Frame):
         self.status_var = tk.StringVar(value="Ready")
         self.progress_var = tk.DoubleVar()
 
+    def _init_fonts(self):
+        """Named fonts shared by every client row and the small buttons."""
+        self._row_font = tkfont.Font(self, font=ROW_FONT)
+        self._status_font = tkfont.Font(self, font=STATUS_FONT)
+        self._button_font = tkfont.Font(self, font=BUTTON_FONT)
+
     def create_widgets(self):
         """Create all GUI widgets"""
         # Title - skipped when embedded, where the host already shows a banner
@@ -196,10 +354,7 @@ class ExtractorPanel(ttk.Frame):
         folder_frame = tk.LabelFrame(
             left_column,
             text="Target Folder",
-            font=('Segoe UI', 11, 'bold'),
-            bg='white',
-            padx=15,
-            pady=15
+            **SECTION_FRAME_OPTIONS
         )
         folder_frame.pack(fill='x', pady=(0, 10))
 
@@ -227,32 +382,30 @@ class ExtractorPanel(ttk.Frame):
             btn_frame,
             text="📁 Browse",
             command=self.browse_folder,
-            font=('Segoe UI', 9),
+            font=self._button_font,
             bg='#6c757d',
             fg='white',
             padx=15,
             pady=5
         ).pack(side='left', padx=(0, 5))
 
-        tk.Button(
+        self.scan_btn = tk.Button(
             btn_frame,
             text="🔍 Scan",
-            command=self.scan_folder,
+            command=lambda: self.scan_folder(background=True),
             font=('Segoe UI', 9, 'bold'),
             bg='#28a745',
             fg='white',
             padx=15,
             pady=5
-        ).pack(side='left')
+        )
+        self.scan_btn.pack(side='left')
 
         # Processing Options Section
         options_frame = tk.LabelFrame(
             left_column,
             text="Processing Options",
-            font=('Segoe UI', 11, 'bold'),
-            bg='white',
-            padx=15,
-            pady=15
+            **SECTION_FRAME_OPTIONS
         )
         options_frame.pack(fill='x', pady=(0, 10))
 
@@ -347,10 +500,7 @@ class ExtractorPanel(ttk.Frame):
         client_frame = tk.LabelFrame(
             right_column,
             text="Select Clients & Reports",
-            font=('Segoe UI', 11, 'bold'),
-            bg='white',
-            padx=15,
-            pady=15
+            **SECTION_FRAME_OPTIONS
         )
         client_frame.pack(fill='both', expand=True)
 
@@ -358,49 +508,23 @@ class ExtractorPanel(ttk.Frame):
         btn_frame = tk.Frame(client_frame, bg='white')
         btn_frame.pack(fill='x', pady=(0, 10))
 
-        tk.Button(
-            btn_frame,
-            text="✓ Select All",
-            command=self.select_all_clients,
-            font=('Segoe UI', 9),
-            bg='#17a2b8',
-            fg='white',
-            padx=10,
-            pady=3
-        ).pack(side='left', padx=(0, 5))
-
-        tk.Button(
-            btn_frame,
-            text="✗ Deselect All",
-            command=self.deselect_all_clients,
-            font=('Segoe UI', 9),
-            bg='#6c757d',
-            fg='white',
-            padx=10,
-            pady=3
-        ).pack(side='left', padx=(0, 5))
-
-        tk.Button(
-            btn_frame,
-            text="ITC Only",
-            command=self.select_itc_only,
-            font=('Segoe UI', 9),
-            bg='#0078D4',
-            fg='white',
-            padx=10,
-            pady=3
-        ).pack(side='left', padx=(0, 5))
-
-        tk.Button(
-            btn_frame,
-            text="Sales Only",
-            command=self.select_sales_only,
-            font=('Segoe UI', 9),
-            bg='#0078D4',
-            fg='white',
-            padx=10,
-            pady=3
-        ).pack(side='left')
+        selection_buttons = (
+            ("✓ Select All", self.select_all_clients, '#17a2b8'),
+            ("✗ Deselect All", self.deselect_all_clients, '#6c757d'),
+            ("ITC Only", self.select_itc_only, '#0078D4'),
+            ("Sales Only", self.select_sales_only, '#0078D4'),
+        )
+        for text, command, colour in selection_buttons:
+            tk.Button(
+                btn_frame,
+                text=text,
+                command=command,
+                font=self._button_font,
+                bg=colour,
+                fg='white',
+                padx=10,
+                pady=3
+            ).pack(side='left', padx=(0, 5))
 
         # Client list with scrollbar
         list_frame = tk.Frame(client_frame, bg='white')
@@ -420,13 +544,11 @@ class ExtractorPanel(ttk.Frame):
                  bg='white', anchor='w').pack(side='left', fill='x', expand=True)
 
         canvas = tk.Canvas(list_frame, bg='white', highlightthickness=0)
+        self._client_canvas = canvas
         scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=canvas.yview)
-        self.scrollable_frame = tk.Frame(canvas, bg='white')
+        self.scrollable_frame = tk.Frame(canvas, bg='white', padx=5)
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self.scrollable_frame.bind("<Configure>", self._schedule_scrollregion)
 
         canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -480,6 +602,29 @@ class ExtractorPanel(ttk.Frame):
         canvas.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
 
+    def _schedule_scrollregion(self, _event=None):
+        """Recompute the client list's scroll region once per idle cycle.
+
+        Rebuilding the list resizes scrollable_frame repeatedly; measuring the
+        canvas bbox for every one of those <Configure> events was wasted work,
+        as only the final size matters.
+        """
+        if self._scrollregion_job is None:
+            self._scrollregion_job = self.after_idle(self._update_scrollregion)
+
+    def _update_scrollregion(self):
+        self._scrollregion_job = None
+        try:
+            # Scroll by whole rows. Every client row is the same height, so one
+            # scroll unit = one row keeps rows aligned to the top edge; the
+            # canvas default (a tenth of its height) left rows cut in half.
+            row_height = self.scrollable_frame.grid_bbox(0, 0)[3]
+            self._client_canvas.configure(
+                scrollregion=self._client_canvas.bbox("all"),
+                yscrollincrement=row_height if self.client_vars else 0)
+        except tk.TclError:
+            pass                      # panel destroyed before the update ran
+
     def on_skip_refresh_toggle(self):
         """Handle skip refresh checkbox toggle"""
         # Update the configuration
@@ -501,10 +646,7 @@ class ExtractorPanel(ttk.Frame):
         progress_frame = tk.LabelFrame(
             main_frame,
             text="Processing Progress",
-            font=('Segoe UI', 11, 'bold'),
-            bg='white',
-            padx=15,
-            pady=15
+            **SECTION_FRAME_OPTIONS
         )
         progress_frame.pack(fill='x', pady=(0, 20))
         
@@ -531,10 +673,7 @@ class ExtractorPanel(ttk.Frame):
         log_frame = tk.LabelFrame(
             main_frame,
             text="Processing Log",
-            font=('Segoe UI', 11, 'bold'),
-            bg='white',
-            padx=15,
-            pady=15
+            **SECTION_FRAME_OPTIONS
         )
         log_frame.pack(fill='both', expand=True)
         
@@ -542,12 +681,15 @@ class ExtractorPanel(ttk.Frame):
         log_container = tk.Frame(log_frame, bg='white')
         log_container.pack(fill='both', expand=True)
         
+        # No undo stack (Tk's default, kept explicit): every line logged
+        # would otherwise be recorded in it too.
         self.log_text = tk.Text(
             log_container,
             height=20,
             wrap='word',
             font=('Consolas', 9),
-            bg='#f8f9fa'
+            bg='#f8f9fa',
+            undo=False
         )
         self.log_text.pack(side='left', fill='both', expand=True)
         
@@ -565,10 +707,8 @@ class ExtractorPanel(ttk.Frame):
         self.log_text.bind("<MouseWheel>", _on_log_mousewheel)
         
         # Configure text tags for colors
-        self.log_text.tag_config('info', foreground='#000000')
-        self.log_text.tag_config('success', foreground='#28a745')
-        self.log_text.tag_config('warning', foreground='#ffc107')
-        self.log_text.tag_config('error', foreground='#dc3545')
+        for level, colour in LOG_LEVEL_COLORS.items():
+            self.log_text.tag_config(level, foreground=colour)
     
     def create_status_bar(self):
         """Create status bar"""
@@ -606,73 +746,84 @@ class ExtractorPanel(ttk.Frame):
         )
         if folder:
             self.folder_path.set(folder)
-            self.scan_folder()
+            self.scan_folder(background=True)
     
-    def scan_folder(self):
-        """Scan folder for clients"""
+    def scan_folder(self, background=False):
+        """Scan folder for clients.
+
+        The scan lists every client and version folder, usually on a network
+        share, and ran on the Tk thread - pressing Scan froze the window for
+        the whole of it. With background=True the disk work runs on a worker
+        thread and _show_scan draws the result on the UI thread; the Scan
+        button is disabled meanwhile. The Scan and Browse buttons use that.
+
+        The default scans in-line, so a caller that reads client_vars straight
+        afterwards (the scan done while the panel is built, the hand-over from
+        the main app's processing step) still finds the clients there.
+        """
         if not self.folder_path.get():
             messagebox.showwarning("No Folder", "Please select a folder first")
             return
-        
+
         self.status_var.set("Scanning folder...")
         self.log_message("Scanning folder for clients...", 'info')
-        
+
+        # Tk variables are read here, on the UI thread, not by the worker.
+        # The generation lets a slow scan that has been superseded (the user
+        # picked another folder meanwhile) be dropped instead of drawn.
+        self._scan_generation += 1
+        args = (self._scan_generation, Path(self.folder_path.get()),
+                self._configured_suffix())
+        if not background:
+            self._show_scan(*self._run_scan(*args))
+            return
+        self.scan_btn.config(state='disabled')
+        threading.Thread(target=self._scan_thread, args=args, daemon=True).start()
+
+    def _scan_thread(self, *args):
+        """Worker-thread body of a background scan_folder."""
+        self._ui(self._show_scan, *self._run_scan(*args))
+
+    def _run_scan(self, generation, base_path, suffix):
+        """Do the disk work of scan_folder. Safe to call off the UI thread."""
         try:
-            # Find Annual Statement folder
-            base_path = Path(self.folder_path.get())
-            annual_folders = list(base_path.glob("Annual Statement-*"))
-            
-            if not annual_folders:
-                self.log_message("No Annual Statement folders found", 'warning')
-                self.status_var.set("No processed folders found")
-                return
-            
-            # Use latest Annual Statement folder
-            latest_folder = max(annual_folders, key=lambda x: x.stat().st_mtime)
-            self.level1_folder = latest_folder  # Store for later use
-            
-            self.log_message(f"Using folder: {latest_folder.name}", 'info')
-            
-            # Find client folders
-            clients = []
-            for client_folder in latest_folder.iterdir():
-                if client_folder.is_dir() and not client_folder.name.startswith('_'):
-                    # Check for version folders
-                    version_folders = list(client_folder.glob("Version-*"))
-                    if version_folders:
-                        # Pick the newest version by modified-time (same as the
-                        # level-1 folder above). Sorting by name is wrong because
-                        # the name is "Version-DDMMYY HHMM" - day-first text does
-                        # not sort chronologically across month boundaries
-                        # (e.g. "300626" would sort after "020726").
-                        latest_version = max(version_folders, key=lambda x: x.stat().st_mtime)
-                        
-                        # Check for report files (single directory listing)
-                        has_itc, has_sales = _classify_version_reports(latest_version)
-
-                        clients.append({
-                            'name': client_folder.name,
-                            'path': client_folder,
-                            'latest_version': latest_version,
-                            'has_itc': has_itc,
-                            'has_sales': has_sales
-                        })
-            
-            self.display_clients(clients)
-            self.log_message(f"Found {len(clients)} clients", 'success')
-            self.status_var.set(f"Found {len(clients)} clients")
-            
+            level1_folder, clients = _find_clients(base_path, suffix)
         except Exception as e:
-            self.log_message(f"Error scanning folder: {e}", 'error')
-            self.status_var.set("Error scanning folder")
             logger.error(f"Scan error: {e}", exc_info=True)
-    
+            return generation, None, [], e
+        return generation, level1_folder, clients, None
+
+    def _show_scan(self, generation, level1_folder, clients, error):
+        """Draw a finished scan (see scan_folder)."""
+        if generation != self._scan_generation:
+            return
+        self.scan_btn.config(state='normal')
+
+        if error is not None:
+            self.log_message(f"Error scanning folder: {error}", 'error')
+            self.status_var.set("Error scanning folder")
+            return
+        if level1_folder is None:
+            self.log_message("No Annual Statement folders found", 'warning')
+            self.status_var.set("No processed folders found")
+            return
+
+        self.level1_folder = level1_folder  # Store for later use
+        self.log_message(f"Using folder: {level1_folder.name}", 'info')
+
+        self.display_clients(clients)
+        self.log_message(f"Found {len(clients)} clients", 'success')
+        self.status_var.set(f"Found {len(clients)} clients")
+
     def display_clients(self, clients):
         """Display client checkboxes with ITC/Sales selection"""
         # Clear existing
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
         self.client_vars.clear()
+        # Start the new list at the top. A re-scan with fewer clients otherwise
+        # kept the old scroll offset and could show an empty stretch of canvas.
+        self._client_canvas.yview_moveto(0)
 
         if not clients:
             tk.Label(
@@ -681,19 +832,30 @@ class ExtractorPanel(ttk.Frame):
                 bg='white',
                 font=('Segoe UI', 10, 'italic'),
                 fg='#666666'
-            ).pack(pady=20)
+            ).grid(row=0, column=0, columnspan=4, pady=20)
             return
 
-        # Create checkboxes for each client
-        for client in clients:
-            # Get last refresh status
-            itc_status, sales_status = self.get_refresh_status(client)
+        # One grid row per client, with the cells gridded straight into
+        # scrollable_frame. Each row used to get its own Frame to pack into -
+        # a fifth widget per client that only existed to hold the other four,
+        # and one more for every rebuild and dark-mode walk to visit.
+        #
+        # The refresh timestamps are NOT read here: that was a directory
+        # listing per client, on what is often a network share. The scan reads
+        # them with the same listing that finds each client's reports, and
+        # hands them over in ClientScan.refresh_status.
+        #
+        # Do not add update()/update_idletasks() inside this loop. Tk lays the
+        # grid out and redraws once, at idle, after the whole list is built;
+        # forcing it per row turns that one pass into one per client.
+        for row, client in enumerate(clients):
+            itc_status, sales_status = client.refresh_status
 
             # Create variables for ITC and Sales checkboxes
-            itc_var = tk.BooleanVar(value=client['has_itc'])
-            sales_var = tk.BooleanVar(value=client['has_sales'])
+            itc_var = tk.BooleanVar(value=client.has_itc)
+            sales_var = tk.BooleanVar(value=client.has_sales)
 
-            self.client_vars[client['name']] = {
+            self.client_vars[client.name] = {
                 'data': client,
                 'itc_var': itc_var,
                 'sales_var': sales_var,
@@ -701,56 +863,54 @@ class ExtractorPanel(ttk.Frame):
                 'sales_status': sales_status
             }
 
-            # Frame for each client
-            client_frame = tk.Frame(self.scrollable_frame, bg='white')
-            client_frame.pack(fill='x', padx=5, pady=2)
-
             # Client name
             name_label = tk.Label(
-                client_frame,
-                text=client['name'],
+                self.scrollable_frame,
+                text=client.name,
                 bg='white',
-                font=('Segoe UI', 10),
+                font=self._row_font,
                 width=30,
                 anchor='w'
             )
-            name_label.pack(side='left')
 
             # ITC checkbox
             itc_cb = tk.Checkbutton(
-                client_frame,
+                self.scrollable_frame,
                 variable=itc_var,
                 bg='white',
-                state='normal' if client['has_itc'] else 'disabled',
+                state='normal' if client.has_itc else 'disabled',
                 width=8
             )
-            itc_cb.pack(side='left')
 
             # Sales checkbox
             sales_cb = tk.Checkbutton(
-                client_frame,
+                self.scrollable_frame,
                 variable=sales_var,
                 bg='white',
-                state='normal' if client['has_sales'] else 'disabled',
+                state='normal' if client.has_sales else 'disabled',
                 width=8
             )
-            sales_cb.pack(side='left')
 
             # Status label
-            status_text = self.format_refresh_status(itc_status, sales_status)
             status_label = tk.Label(
-                client_frame,
-                text=status_text,
+                self.scrollable_frame,
+                text=self.format_refresh_status(itc_status, sales_status),
                 bg='white',
-                font=('Segoe UI', 9),
-                fg='#666',
+                font=self._status_font,
+                fg=STATUS_FG,
                 width=40,
                 anchor='w'
             )
-            status_label.pack(side='left')
+
+            # All four cells placed with ONE grid command - Tk's grid takes
+            # several widgets and puts them in consecutive columns - instead of
+            # a Tcl round trip each. The 5px left inset the name column had is
+            # the frame's own padx (see create_setup_tab).
+            self.tk.call('grid', name_label, itc_cb, sales_cb, status_label,
+                         '-row', row, '-pady', 2, '-sticky', 'w')
             # Keep the label so the timestamps can be updated in place after a
             # run (see refresh_status_display).
-            self.client_vars[client['name']]['status_label'] = status_label
+            self.client_vars[client.name]['status_label'] = status_label
 
         # Enable process button
         if clients:
@@ -768,11 +928,18 @@ class ExtractorPanel(ttk.Frame):
         Updates the labels in place rather than re-scanning, which keeps the
         user's ITC/Sales tick selections intact.
         """
+        # The suffix setting is read from its Tk variable once for the whole
+        # list, not once per client.
+        suffix = self._configured_suffix()
         for data in self.client_vars.values():
             label = data.get('status_label')
             if label is None:
                 continue
-            itc_status, sales_status = self.get_refresh_status(data['data'])
+            itc_status, sales_status = self.get_refresh_status(data['data'], suffix)
+            # Only rows whose timestamps moved need redrawing - usually just the
+            # clients in the run that finished, not the whole list.
+            if (itc_status, sales_status) == (data['itc_status'], data['sales_status']):
+                continue
             data['itc_status'] = itc_status
             data['sales_status'] = sales_status
             try:
@@ -781,11 +948,16 @@ class ExtractorPanel(ttk.Frame):
             except tk.TclError:
                 pass    # row was destroyed (e.g. a re-scan happened meanwhile)
 
-    def get_refresh_status(self, client):
-        """Get last refresh status from existing files (single directory listing)"""
+    def get_refresh_status(self, client, suffix_pattern=None):
+        """Get last refresh status from existing files (single directory listing)
+
+        Pass suffix_pattern when looking up many clients, so the setting is not
+        read again for each one.
+        """
+        if suffix_pattern is None:
+            suffix_pattern = self._configured_suffix()
         try:
-            return _latest_refresh_times(client['latest_version'],
-                                         self._configured_suffix())
+            return _latest_refresh_times(client.latest_version, suffix_pattern)
         except Exception:
             return None, None
 
@@ -809,32 +981,62 @@ class ExtractorPanel(ttk.Frame):
 
     def select_all_clients(self):
         """Select all clients and reports"""
-        for client_data in self.client_vars.values():
-            if client_data['data']['has_itc']:
-                client_data['itc_var'].set(True)
-            if client_data['data']['has_sales']:
-                client_data['sales_var'].set(True)
+        self._apply_selection(True, True)
 
     def deselect_all_clients(self):
         """Deselect all clients and reports"""
-        for client_data in self.client_vars.values():
-            client_data['itc_var'].set(False)
-            client_data['sales_var'].set(False)
+        self._apply_selection(False, False)
 
     def select_itc_only(self):
         """Select only ITC reports"""
-        for client_data in self.client_vars.values():
-            if client_data['data']['has_itc']:
-                client_data['itc_var'].set(True)
-            client_data['sales_var'].set(False)
+        self._apply_selection(True, False)
 
     def select_sales_only(self):
         """Select only Sales reports"""
+        self._apply_selection(False, True)
+
+    def _apply_selection(self, itc_state, sales_state):
+        """Set every client's ITC and Sales checkbox in one pass.
+
+        True ticks the box where that report exists, False clears it and None
+        leaves it as it is. The four selection buttons are one-line calls to
+        this, so the walk over client_vars lives in one place.
+        """
+        changes = []
         for client_data in self.client_vars.values():
-            client_data['itc_var'].set(False)
-            if client_data['data']['has_sales']:
-                client_data['sales_var'].set(True)
-    
+            client = client_data['data']
+            if itc_state is not None and (client.has_itc or not itc_state):
+                changes.append((client_data['itc_var'], itc_state))
+            if sales_state is not None and (client.has_sales or not sales_state):
+                changes.append((client_data['sales_var'], sales_state))
+        self._set_checks(changes)
+
+    def _set_checks(self, changes):
+        """Set many checkbox variables in ONE Tcl call.
+
+        var.set() is a Python -> Tcl round trip per checkbox, two per client,
+        so the bulk selection buttons cost hundreds of them on a large list.
+        The checkbuttons still follow their variables through Tk's own traces.
+
+        Variables already at their target are left alone, so only checkboxes
+        that actually change are redrawn - pressing "ITC Only" twice touches
+        nothing the second time.
+        """
+        current = self._read_checks([var for var, _value in changes])
+        items = tuple(part for (var, value), now in zip(changes, current)
+                      if bool(value) != now
+                      for part in (str(var), int(value)))
+        if items:
+            self.tk.call('::pqe_set_vars', items)
+
+    def _read_checks(self, variables):
+        """Read many checkbox variables in ONE Tcl call (see _set_checks)."""
+        if not variables:
+            return []
+        values = self.tk.splitlist(self.tk.call(
+            '::pqe_get_vars', tuple(str(var) for var in variables)))
+        return [bool(self.tk.getboolean(value)) for value in values]
+
     def on_tab_changed(self, event):
         """Handle tab change"""
         selected_tab = event.widget.tab('current')['text']
@@ -846,12 +1048,15 @@ class ExtractorPanel(ttk.Frame):
         """Start processing selected clients and reports"""
         selected = []
 
-        for name, data in self.client_vars.items():
-            process_itc = data['itc_var'].get()
-            process_sales = data['sales_var'].get()
+        entries = list(self.client_vars.values())
+        ticks = self._read_checks(
+            [var for data in entries for var in (data['itc_var'], data['sales_var'])])
+
+        for i, data in enumerate(entries):
+            process_itc, process_sales = ticks[2 * i], ticks[2 * i + 1]
 
             if process_itc or process_sales:
-                client_info = data['data'].copy()
+                client_info = data['data']._asdict()
                 client_info['process_itc'] = process_itc
                 client_info['process_sales'] = process_sales
                 selected.append(client_info)
@@ -871,8 +1076,7 @@ class ExtractorPanel(ttk.Frame):
         self.process_btn.config(state='disabled')
         self.is_processing = True
 
-        # Clear log
-        self.log_text.delete(1.0, tk.END)
+        self._clear_log()
 
         # Start processing thread
         thread = threading.Thread(
@@ -1011,22 +1215,81 @@ class ExtractorPanel(ttk.Frame):
 
     def update_progress(self, value, message):
         """Update progress bar and label (safe from any thread)"""
-        self._ui(self._apply_progress, value, message)
+        # Latest wins: if a redraw is already queued it picks this value up, so
+        # a burst of updates costs one redraw, not one each.
+        with self._log_lock:
+            pending = self._pending_progress
+            self._pending_progress = (value, message)
+        if pending is None:
+            self._ui(self._flush_progress)
+
+    def _flush_progress(self):
+        with self._log_lock:
+            latest = self._pending_progress
+            self._pending_progress = None
+        if latest is not None:
+            self._apply_progress(*latest)
 
     def _apply_progress(self, value, message):
-        self.progress_var.set(value)
-        self.progress_label.config(text=message)
-        self.status_var.set(message)
+        # Only redraw what moved: the bar when the value changes by at least
+        # the 0.1% it can show, the label and status line when the message does.
+        value = round(value, 1)
+        last_value, last_message = self._shown_progress or (None, None)
+        self._shown_progress = (value, message)
+        if value != last_value:
+            self.progress_var.set(value)
+        if message != last_message:
+            self.progress_label.config(text=message)
+            self.status_var.set(message)
 
     def log_message(self, message, level='info'):
         """Add message to log (safe from any thread)"""
         # Timestamp is taken now, when the event happened, not when it is drawn.
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self._ui(self._append_log, f"[{timestamp}] {message}\n", level)
-
-    def _append_log(self, text, level):
-        self.log_text.insert('end', text, level)
-        self.log_text.see('end')
+        line = f"{_timestamp_prefix()}{message}\n"
+        # Queued rather than drawn one by one: the worker logs several lines
+        # per client, and each insert + see('end') was its own UI callback and
+        # redraw. Only the first line of a batch schedules a flush; lines
+        # logged before it runs are written with it.
+        with self._log_lock:
+            first = not self._pending_log
+            self._pending_log.append(
+                (line, level if level in LOG_LEVEL_COLORS else ''))
+        if first:
+            self._ui(self._flush_log)
+
+    def _clear_log(self):
+        """Empty the log for a new run, including lines not yet drawn.
+
+        Lines still queued when the log was cleared (the scan's, say) were
+        flushed straight after it, at the top of the new run's log. The
+        progress guard is reset too, so the run's first value is always drawn.
+        """
+        with self._log_lock:
+            self._pending_log.clear()
+            self._shown_progress = None
+        self.log_text.delete('1.0', 'end')
+
+    def _flush_log(self):
+        with self._log_lock:
+            lines = list(self._pending_log)
+            self._pending_log.clear()
+        if not lines:
+            return
+        # One insert for the whole batch: Text.insert takes any number of
+        # text/tag pairs, and consecutive lines of the same level share one.
+        args = []
+        for text, level in lines:
+            if args and args[-1] == level:
+                args[-2] += text
+            else:
+                args += [text, level]
+        # Only follow the end if the view is already there, so a user reading
+        # back through the log is not scrolled away (and redrawn) every flush.
+        follow = self.log_text.yview()[1] >= 1.0
+        self.log_text.insert('end', *args)
+        self.log_text.delete('1.0', f'end-{LOG_MAX_LINES + 1}l')
+        if follow:
+            self.log_text.see('end')
 
 
 class PowerQueryExtractorApp(tk.Tk):
@@ -0,0 +1,129 @@
+"""Tests for CacheManager - the settings file shared with the extractor.
+
+save_cache used to re-read and re-parse the whole file on every save just to
+carry recent_folders forward. It now works from cache_data, which is only safe
+if cache_data is kept in step with the file; these pin that it is.
+"""
+import json
+
+from gui.utils.cache_manager import CacheManager
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / 'cache.json'
+    CacheManager(path).save_cache({'source_folder': 'A', 'dark_mode': True})
+
+    loaded = CacheManager(path).load_cache()
+    assert loaded['dark_mode'] is True
+    assert loaded['recent_folders'] == ['A']
+
+
+def test_recent_folders_carry_across_saves_without_reloading(tmp_path):
+    path = tmp_path / 'cache.json'
+    manager = CacheManager(path)
+    for folder in ('A', 'B', 'C'):
+        manager.save_cache({'source_folder': folder})
+
+    on_disk = json.loads(path.read_text())
+    assert on_disk['recent_folders'] == ['C', 'B', 'A']
+
+
+def test_recent_folders_are_capped_at_five(tmp_path):
+    manager = CacheManager(tmp_path / 'cache.json')
+    for i in range(7):
+        manager.save_cache({'source_folder': f'F{i}'})
+    assert manager.cache_data['recent_folders'] == ['F6', 'F5', 'F4', 'F3', 'F2']
+
+
+def test_overlong_list_on_disk_keeps_the_most_recent(tmp_path):
+    path = tmp_path / 'cache.json'
+    path.write_text(json.dumps({'recent_folders': [f'F{i}' for i in range(8)]}))
+
+    CacheManager(path).save_cache({'source_folder': 'F1'})
+
+    assert json.loads(path.read_text())['recent_folders'] == ['F0', 'F1', 'F2', 'F3', 'F4']
+
+
+def test_first_save_keeps_recent_folders_already_on_disk(tmp_path):
+    """A fresh manager that has not loaded yet must still read the file."""
+    path = tmp_path / 'cache.json'
+    path.write_text(json.dumps({'recent_folders': ['OLD']}))
+
+    CacheManager(path).save_cache({'source_folder': 'NEW'})
+
+    assert json.loads(path.read_text())['recent_folders'] == ['NEW', 'OLD']
+
+
+def test_unchanged_file_is_not_parsed_again(tmp_path, monkeypatch):
+    from gui.utils import cache_manager
+
+    path = tmp_path / 'cache.json'
+    path.write_text(json.dumps({'dark_mode': False}))
+    manager = CacheManager(path)
+    manager.load_cache()
+
+    calls = []
+    real_loads = cache_manager._loads
+    monkeypatch.setattr(cache_manager, '_loads',
+                        lambda raw: calls.append(1) or real_loads(raw))
+    assert manager.load_cache() == {'dark_mode': False}
+    assert calls == []
+
+
+def test_missing_file_loads_empty(tmp_path):
+    assert CacheManager(tmp_path / 'absent.json').load_cache() == {}
+
+
+def test_save_leaves_no_temp_file_behind(tmp_path):
+    CacheManager(tmp_path / 'cache.json').save_cache({'source_folder': 'A'})
+    assert [p.name for p in tmp_path.iterdir()] == ['cache.json']
+
+
+def test_failed_write_keeps_the_previous_settings(tmp_path, monkeypatch):
+    """The old streaming json.dump truncated the file before writing, so an
+    error part way through lost every saved setting."""
+    from gui.utils import cache_manager
+
+    path = tmp_path / 'cache.json'
+    manager = CacheManager(path)
+    manager.save_cache({'source_folder': 'A', 'dark_mode': True})
+
+    def broken_dumps(data):
+        raise OSError('disk full')
+    monkeypatch.setattr(cache_manager, '_dumps', broken_dumps)
+    manager.save_cache({'source_folder': 'B', 'dark_mode': False})
+
+    assert json.loads(path.read_text())['dark_mode'] is True
+
+
+def test_unchanged_settings_are_not_rewritten(tmp_path, monkeypatch):
+    from gui.utils import cache_manager
+
+    manager = CacheManager(tmp_path / 'cache.json')
+    manager.save_cache({'source_folder': 'A', 'dark_mode': True})
+
+    calls = []
+    real_dumps = cache_manager._dumps
+    monkeypatch.setattr(cache_manager, '_dumps',
+                        lambda data: calls.append(1) or real_dumps(data))
+    manager.save_cache({'source_folder': 'A', 'dark_mode': True})
+    assert calls == []
+
+    manager.save_cache({'source_folder': 'A', 'dark_mode': False})
+    assert calls == [1]
+
+
+def test_deleted_file_is_written_again_even_if_unchanged(tmp_path):
+    path = tmp_path / 'cache.json'
+    manager = CacheManager(path)
+    manager.save_cache({'source_folder': 'A'})
+    path.unlink()
+
+    manager.save_cache({'source_folder': 'A'})
+    assert path.exists()
+
+
+def test_corrupt_file_loads_empty(tmp_path):
+    path = tmp_path / 'cache.json'
+    path.write_text('{"dark_mode": tr')
+    assert CacheManager(path).load_cache() == {}
@@ -0,0 +1,48 @@
+"""Tests for the client tree's row data (gui.handlers.client_handler.client_rows).
+
+The rows are worked out as plain data before the tree is touched, so what each
+client shows - and which colour tag it gets - is checked here without a display.
+"""
+from gui.handlers.client_handler import (
+    COMPLETE_TAGS, FOLDER_NAME_OFF, INCOMPLETE_TAGS, client_rows,
+)
+
+
+def make_client(name, status='Complete', icon='✅', missing=(), extra=(), count=6):
+    return {
+        'client': name,
+        'state': 'Delhi',
+        'status': status,
+        'status_icon': icon,
+        'missing_files': list(missing),
+        'extra_files': list(extra),
+        'file_count': count,
+    }
+
+
+def test_complete_client_row():
+    rows = client_rows({'ABC-DL': make_client('ABC')})
+    assert rows == [('ABC-DL',
+                     ('ABC', 'Delhi', '✅ Complete', '6', 'None', '0', FOLDER_NAME_OFF),
+                     COMPLETE_TAGS)]
+
+
+def test_incomplete_client_lists_what_is_missing():
+    client = make_client('XYZ', status='Missing 2 files', icon='⚠️',
+                         missing=('Sales', 'GSTR-3B Export'), count=4)
+    (_key, values, tags), = client_rows({'XYZ-DL': client})
+    assert values[2] == '⚠️ Missing 2 files'
+    assert values[4] == 'Sales, GSTR-3B Export'
+    assert tags is INCOMPLETE_TAGS
+
+
+def test_counts_are_text_even_beyond_the_cached_range():
+    client = make_client('BIG', count=1000, extra=['x'] * 3)
+    (_key, values, _tags), = client_rows({'BIG-DL': client})
+    assert values[3] == '1000'
+    assert values[5] == '3'
+
+
+def test_rows_keep_the_scan_order():
+    data = {'B-DL': make_client('B'), 'A-DL': make_client('A')}
+    assert [key for key, _values, _tags in client_rows(data)] == ['B-DL', 'A-DL']
@@ -108,6 +108,21 @@ class TestRoundTrip:
         assert str(widgets['dark_button'].cget('foreground')) == 'black'
 
 
+    def test_restore_while_already_light_is_a_no_op(self, scene, root):
+        """Restoring when not dark must not replay colours captured at the last
+        dark switch over changes made since."""
+        manager, _container, widgets = scene
+        manager.apply_dark_mode()
+        manager.restore_original_colors()
+        widgets['tinted_row'].configure(bg='#FDECEA')   # state changed in light
+        root.update_idletasks()
+
+        manager.restore_original_colors()
+        root.update_idletasks()
+
+        assert str(widgets['tinted_row'].cget('background')) == '#FDECEA'
+
+
 class TestDarkApplication:
     def test_widgets_actually_go_dark(self, scene, root):
         manager, _container, widgets = scene
@@ -140,6 +155,33 @@ class TestDarkApplication:
 
         assert str(late.cget('background')) == '#123456'
 
+    def test_subtree_call_themes_only_that_subtree(self, scene, root):
+        """Widgets built while dark are themed on their own, without re-walking the app."""
+        manager, container, widgets = scene
+        manager.apply_dark_mode()
+        widgets['tinted_row'].configure(bg='#FDECEA')   # changed after the toggle
+
+        late = tk.Frame(container, bg='#123456')
+        late.pack()
+        root.update_idletasks()
+        manager.apply_dark_mode(late)
+
+        assert str(late.cget('background')) == manager.dark_colors['bg']
+        assert str(widgets['tinted_row'].cget('background')) == '#FDECEA'
+
+        manager.restore_original_colors()
+        root.update_idletasks()
+        assert str(late.cget('background')) == '#123456'
+
+    def test_subtree_call_while_light_changes_nothing(self, scene, root):
+        manager, container, _widgets = scene
+        late = tk.Frame(container, bg='#123456')
+        late.pack()
+        manager.apply_dark_mode(late)
+
+        assert not manager.is_dark_mode
+        assert str(late.cget('background')) == '#123456'
+
 
 class TestTreeTags:
     """Regression: the else branch was attached to `if hasattr(...)`, so light
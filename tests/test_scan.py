@@ -78,3 +78,30 @@ def test_complete_client_marked_complete(parser, tmp_path, make_excel):
     abc = client_data["ABC-DL"]
     assert abc["missing_files"] == []
     assert abc["status"] == "Complete"
+
+
+def test_statistics_tally_files_and_clients(parser, tmp_path, make_excel):
+    # ABC has every expected type; XYZ only Sales; MysteryFile parses as nothing.
+    make_excel(tmp_path / "GSTR-2B-Reco-ABC-Delhi-Q1.xlsx")
+    make_excel(tmp_path / "ImsReco-ABC-Delhi-01012024.xlsx")
+    make_excel(tmp_path / "GSTR3B-ABC-Delhi-Jan.xlsx", size=4096)
+    make_excel(tmp_path / "Sales-ABC-Delhi-Apr-Jun.xlsx")
+    make_excel(tmp_path / "SalesReco-ABC-Delhi-Q1.xlsx")
+    make_excel(tmp_path / "AnnualReport-ABC-Delhi-2024.xlsx")
+    make_excel(tmp_path / "Sales-XYZ-Delhi-Apr-Jun.xlsx", size=3072)
+    make_excel(tmp_path / "MysteryFile.xlsx", size=1024)
+
+    parser.scan_folder(tmp_path)
+    stats = parser.get_statistics()
+
+    assert stats['total_files'] == 8
+    assert stats['parsed_files'] == 7
+    assert stats['unparsed_files'] == 1
+    assert stats['total_size'] == 5 * 2048 + 4096 + 3072 + 1024
+    assert stats['total_clients'] == 2
+    assert stats['complete_clients'] == 1
+    assert stats['incomplete_clients'] == 1
+    assert stats['file_type_distribution'] == {
+        'GSTR-2B Reco': 1, 'IMS Reco': 1, 'GSTR-3B Export': 1,
+        'Sales': 2, 'Sales Reco': 1, 'Annual Report': 1,
+    }
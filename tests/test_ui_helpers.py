@@ -0,0 +1,52 @@
+"""Tests for the log and progress batching in gui.utils.ui_helpers.
+
+A flush writes every queued line with ONE Text.insert call; _insert_args builds
+its argument list, so it decides what text each line ends up tagged with.
+update_progress skips writes that would not change what is shown.
+"""
+from gui.utils.ui_helpers import UIHelpers, _insert_args
+
+
+def test_each_line_keeps_its_tag():
+    lines = [("a\n", 'info'), ("b\n", 'error'), ("c\n", 'info')]
+    assert _insert_args(lines) == ["a\n", 'info', "b\n", 'error', "c\n", 'info']
+
+
+def test_consecutive_lines_of_one_level_are_joined():
+    lines = [("a\n", 'warning'), ("b\n", 'warning'), ("c\n", 'success')]
+    assert _insert_args(lines) == ["a\nb\n", 'warning', "c\n", 'success']
+
+
+def test_untagged_lines_stay_untagged():
+    """log_message queues 'normal' lines with an empty tag."""
+    lines = [("a\n", ''), ("b\n", ''), ("c\n", 'error'), ("d\n", '')]
+    assert _insert_args(lines) == ["a\nb\n", '', "c\n", 'error', "d\n", '']
+
+
+def test_empty_batch():
+    assert _insert_args([]) == []
+
+
+class _Recorder:
+    """Stands in for a Tk variable or label, counting the writes it receives."""
+
+    def __init__(self):
+        self.writes = []
+
+    def set(self, value):
+        self.writes.append(value)
+
+    def config(self, **options):
+        self.writes.append(options['text'])
+
+
+def test_progress_redraws_only_what_changed():
+    var, label, operation = _Recorder(), _Recorder(), _Recorder()
+
+    UIHelpers.update_progress(var, label, operation, 10.0, "file 1")
+    UIHelpers.update_progress(var, label, operation, 10.02, "file 2")   # same 0.1%
+    UIHelpers.update_progress(var, label, operation, 12.5, "file 2")
+
+    assert var.writes == [10.0, 12.5]
+    assert label.writes == ["📊 Progress: 10.0%", "📊 Progress: 12.5%"]
+    assert operation.writes == ["file 1", "file 2"]
@@ -6,7 +6,7 @@ Contains utility functions and constants.
 from .constants import (
     FILE_PATTERNS, EXPECTED_FILE_TYPES, FOLDER_STRUCTURE,
     EXCEL_TEMPLATE_MAPPING, GUI_CONFIG, PROCESSING_MODES,
-    MESSAGES, EXCEL_EXTENSIONS, EXCEL_SAFETY
+    PROCESSING_MODE_CHOICES, MESSAGES, EXCEL_EXTENSIONS, EXCEL_SAFETY
 )
 
 from .helpers import (
@@ -23,7 +23,7 @@ __all__ = [
     # Constants
     'FILE_PATTERNS', 'EXPECTED_FILE_TYPES', 'FOLDER_STRUCTURE',
     'EXCEL_TEMPLATE_MAPPING', 'GUI_CONFIG', 'PROCESSING_MODES',
-    'MESSAGES', 'EXCEL_EXTENSIONS', 'EXCEL_SAFETY',
+    'PROCESSING_MODE_CHOICES', 'MESSAGES', 'EXCEL_EXTENSIONS', 'EXCEL_SAFETY',
     
     # Helpers
     'get_timestamp', 'get_date_only', 'get_safe_timestamp',
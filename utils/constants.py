@@ -156,6 +156,22 @@ GUI_CONFIG = {
     }
 }
 
+# Client list layout: (column id, width, minwidth, heading). '#0' is the
+# checkbox column. The Validation tab builds the tree from this, and
+# ClientHandler reads row values by position, so the order of the data columns
+# matters.
+CLIENT_TREE_COLUMNS = (
+    ('#0', 50, 20, '✓'),
+    ('Client', 250, 20, '🏢 Client Name'),
+    ('State', 100, 20, '🌏 State'),
+    ('Status', 150, 20, '📊 Status'),
+    ('Files', 60, 20, '📁 Files'),
+    ('Missing', 180, 20, '❌ Missing'),
+    ('Extra', 80, 20, '➕ Extra'),
+    ('FolderName', 100, 80, '📁 Name'),
+)
+CLIENT_TREE_DATA_COLUMNS = tuple(c[0] for c in CLIENT_TREE_COLUMNS[1:])
+
 # ============================================================================
 # PROCESSING MODES
 # ============================================================================
@@ -189,6 +205,13 @@ PROCESSING_MODES = {
     }
 }
 
+# (key, name, description) per mode, in display order - what the Setup tab's
+# radio list iterates, so it does not re-index the nested dicts per row.
+PROCESSING_MODE_CHOICES: Tuple[Tuple[str, str, str], ...] = tuple(
+    (key, info['name'], info['description'])
+    for key, info in PROCESSING_MODES.items()
+)
+
 # ============================================================================
 # FILE VALIDATION
 # ============================================================================
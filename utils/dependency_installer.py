@@ -12,9 +12,11 @@ pick it up afterwards.
 The pure helpers here (command building, message text) are unit-tested; the Tk
 dialog is a thin shell around them.
 """
+import collections
 import logging
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -22,6 +24,15 @@ logger = logging.getLogger(__name__)
 # Never let an install run forever behind a hanging proxy.
 INSTALL_TIMEOUT_SECONDS = 600
 
+# The install window keeps only the last this-many lines of pip's output: what
+# matters is how it ended, and a long dependency resolve can print thousands.
+INSTALL_LOG_MAX_LINES = 2000
+
+# pip runs on a worker thread; the window polls it this often, and writes what
+# install() has logged (the command line, then pip's whole output once it
+# exits) when it comes in.
+INSTALL_LOG_FLUSH_MS = 50
+
 
 def build_pip_command(packages=None, requirements_path=None):
     """The pip command to run, always against the RUNNING interpreter.
@@ -121,24 +132,69 @@ def offer_install(results, requirements_path=None, parent=None):
         window = tk.Toplevel(parent or root)
         window.title("Installing…")
         window.geometry("760x380")
-        text = scrolledtext.ScrolledText(window, font=('Consolas', 9), wrap='word')
+        # Append-only: no undo stack to record pip's output into, read-only so
+        # a stray click cannot edit it.
+        text = scrolledtext.ScrolledText(window, font=('Consolas', 9), wrap='word',
+                                         undo=False, state='disabled')
         text.pack(fill='both', expand=True, padx=10, pady=10)
-
-        def log(message):
+        # Not closable until pip is done: the result is written to this window,
+        # and closing it mid-install used to turn a successful install into a
+        # failed offer (no restart).
+        window.protocol('WM_DELETE_WINDOW', lambda: None)
+
+        def write(message):
+            follow = text.yview()[1] >= 1.0
+            text.config(state='normal')
             text.insert('end', message)
-            text.see('end')
-            text.update_idletasks()
-
-        log(f"Installing into: {sys.executable}\n\n")
-        ok, output = install(packages=None if requirements_path else packages,
-                             requirements_path=requirements_path, log=log)
+            text.delete('1.0', f'end-{INSTALL_LOG_MAX_LINES + 1}l')
+            text.config(state='disabled')
+            if follow:
+                text.see('end')
+
+        # pip used to run right here, on the UI thread, so the window did not
+        # repaint - or answer the OS - until it finished: it looked frozen for
+        # exactly as long as it mattered that it did not. It now runs on a
+        # worker while this thread keeps handling events.
+        pending = collections.deque()
+        result = []
+        owner = parent or root
+        finished = tk.BooleanVar(owner, False)
+        worker = threading.Thread(
+            target=lambda: result.append(install(
+                packages=None if requirements_path else packages,
+                requirements_path=requirements_path, log=pending.append)),
+            daemon=True)
+
+        def tick():
+            # Checked before draining, so lines pip's last moments queue are
+            # still written by this tick or the next.
+            alive = worker.is_alive()
+            if pending:
+                batch = []
+                while pending:
+                    batch.append(pending.popleft())
+                try:
+                    write(''.join(batch))
+                except tk.TclError:     # window gone; keep polling for the result
+                    pass
+            if alive:
+                owner.after(INSTALL_LOG_FLUSH_MS, tick)
+            else:
+                finished.set(True)
+
+        write(f"Installing into: {sys.executable}\n\n")
+        worker.start()
+        owner.after(INSTALL_LOG_FLUSH_MS, tick)
+        owner.wait_variable(finished)
+        ok, output = result[0] if result else (False, "The install did not finish.")
+        window.protocol('WM_DELETE_WINDOW', window.destroy)
 
         if ok:
-            log("\n\n✅ Installed successfully. Restarting the app…")
+            write("\n\n✅ Installed successfully. Restarting the app…")
             window.update_idletasks()
             return True
 
-        log("\n\n❌ Installation failed.")
+        write("\n\n❌ Installation failed.")
         manual = ' '.join(build_pip_command(packages, requirements_path))
         messagebox.showerror(
             "Installation failed",